@@ -11,8 +11,6 @@ Usage:
     teeclip --list                # show clipboard history
 """
 
-from ._version import __version__, get_version, get_base_version, VERSION, BASE_VERSION
-
 __all__ = [
     "__version__",
     "get_version",
@@ -20,3 +18,21 @@ __all__ = [
     "VERSION",
     "BASE_VERSION",
 ]
+
+
+def __getattr__(name):
+    """Resolve version symbols from ._version on first access (PEP 562).
+
+    Keeps `import teeclip` (and every CLI start) from executing the
+    version module until something actually asks for it.
+    """
+    if name in __all__:
+        from . import _version
+        value = getattr(_version, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
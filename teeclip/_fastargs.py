@@ -0,0 +1,144 @@
+"""
+Hand-rolled parser for teeclip's fixed command-line grammar.
+
+Covers every option build_parser() defines, so ordinary invocations never
+import argparse.  parse() returns None for anything it is not certain to
+read exactly the way argparse would (abbreviated options, combined short
+flags, `--`, option-like values, malformed numbers, ...); the caller then
+falls back to the full parser, which also owns all error reporting.
+"""
+
+from types import SimpleNamespace
+
+
+def defaults() -> SimpleNamespace:
+    """Return the values build_parser() produces for an empty argv."""
+    return SimpleNamespace(
+        files=[],
+        append=False,
+        paste=False,
+        backend=None,
+        no_clipboard=False,
+        quiet=False,
+        list_history=None,
+        get_clip=None,
+        clear_history=None,
+        save_clip=False,
+        show_config=False,
+        no_history=False,
+        encrypt=False,
+        decrypt=False,
+    )
+
+
+# Boolean flags, mapped to their args attribute
+_FLAGS = {
+    "-a": "append",
+    "--append": "append",
+    "-p": "paste",
+    "--paste": "paste",
+    "-nc": "no_clipboard",
+    "--no-clipboard": "no_clipboard",
+    "-q": "quiet",
+    "--quiet": "quiet",
+    "-s": "save_clip",
+    "--save": "save_clip",
+    "--config": "show_config",
+    "--no-history": "no_history",
+    "--encrypt": "encrypt",
+    "--decrypt": "decrypt",
+}
+
+# Value-taking options: option string -> (dest, kind)
+#   "str"  required string value
+#   "int"  required integer value
+#   "list" optional value, int >= 1 or "all" (-1); bare flag gives 0
+#   "sel"  optional string value; bare flag gives "all"
+_VALUED = {
+    "--backend": ("backend", "str"),
+    "--get": ("get_clip", "int"),
+    "-g": ("get_clip", "int"),
+    "--list": ("list_history", "list"),
+    "-l": ("list_history", "list"),
+    "--clear": ("clear_history", "sel"),
+}
+
+_BARE = {"list": 0, "sel": "all"}
+
+_INVALID = object()
+
+
+def _convert(kind, value):
+    """Convert an option value, or return _INVALID to defer to argparse."""
+    if kind == "int":
+        try:
+            return int(value)
+        except ValueError:
+            return _INVALID
+    if kind == "list":
+        if value.lower() == "all":
+            return -1
+        try:
+            n = int(value)
+        except ValueError:
+            return _INVALID
+        return n if n >= 1 else _INVALID
+    return value
+
+
+def parse(argv):
+    """Parse argv into the namespace build_parser() would produce.
+
+    Returns None when argparse should handle argv instead.
+    """
+    args = defaults()
+    files = args.files
+    files_done = False  # argparse takes FILE... as one contiguous run
+    i = 0
+    n = len(argv)
+    while i < n:
+        arg = argv[i]
+        i += 1
+        if arg[:1] != "-" or arg == "-":
+            if arg == "-" or files_done:
+                return None
+            files.append(arg)
+            continue
+        if files:
+            files_done = True
+
+        dest = _FLAGS.get(arg)
+        if dest is not None:
+            setattr(args, dest, True)
+            continue
+
+        # --opt=value, -Xvalue, or --opt [value]
+        value = None
+        spec = _VALUED.get(arg)
+        if spec is None:
+            if arg[:2] == "--":
+                name, eq, value = arg.partition("=")
+                spec = _VALUED.get(name) if eq else None
+            elif arg[:2] in ("-g", "-l"):
+                spec = _VALUED[arg[:2]]
+                value = arg[2:]
+            if spec is None:
+                return None
+        dest, kind = spec
+
+        if value is None:
+            nxt = argv[i] if i < n else None
+            if nxt is not None and nxt[:1] != "-":
+                value = nxt
+                i += 1
+            elif kind in _BARE and (nxt is None or nxt in _FLAGS or nxt in _VALUED):
+                setattr(args, dest, _BARE[kind])
+                continue
+            else:
+                return None
+
+        value = _convert(kind, value)
+        if value is _INVALID:
+            return None
+        setattr(args, dest, value)
+    return args
@@ -3,10 +3,17 @@ Centralized path resolution for teeclip data directory.
 
 The data directory (~/.teeclip/) stores history database and config file.
 Supports TEECLIP_HOME env var override for testing and custom installs.
+
+Resolved paths are cached per TEECLIP_HOME value, so repeated lookups
+during one invocation don't rebuild Path objects.  Changing the env var
+(as the test fixtures do) naturally selects a different cache entry;
+clear_path_cache() drops everything, e.g. after HOME itself changes.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 
 def get_data_dir() -> Path:
@@ -15,20 +22,17 @@ def get_data_dir() -> Path:
     Checks TEECLIP_HOME env var first (for testing and custom installs),
     then falls back to ~/.teeclip/.
     """
-    env_dir = os.environ.get("TEECLIP_HOME")
-    if env_dir:
-        return Path(env_dir)
-    return Path.home() / ".teeclip"
+    return _data_dir(os.environ.get("TEECLIP_HOME"))
 
 
 def get_history_db_path() -> Path:
     """Return the path to the history SQLite database."""
-    return get_data_dir() / "history.db"
+    return _history_db_path(os.environ.get("TEECLIP_HOME"))
 
 
 def get_config_path() -> Path:
     """Return the path to the config TOML file."""
-    return get_data_dir() / "config.toml"
+    return _config_path(os.environ.get("TEECLIP_HOME"))
 
 
 def ensure_data_dir() -> Path:
@@ -36,3 +40,31 @@ def ensure_data_dir() -> Path:
     data_dir = get_data_dir()
     data_dir.mkdir(parents=True, exist_ok=True)
     return data_dir
+
+
+def clear_path_cache() -> None:
+    """Forget all cached path resolutions."""
+    _data_dir.cache_clear()
+    _history_db_path.cache_clear()
+    _config_path.cache_clear()
+
+
+def _data_dir_str(env_dir: Optional[str]) -> str:
+    return env_dir or os.path.join(os.path.expanduser("~"), ".teeclip")
+
+
+# Each cached Path is built with a single constructor call from the
+# directory string, rather than deriving one Path from another.
+@lru_cache(maxsize=None)
+def _data_dir(env_dir: Optional[str]) -> Path:
+    return Path(_data_dir_str(env_dir))
+
+
+@lru_cache(maxsize=None)
+def _history_db_path(env_dir: Optional[str]) -> Path:
+    return Path(_data_dir_str(env_dir), "history.db")
+
+
+@lru_cache(maxsize=None)
+def _config_path(env_dir: Optional[str]) -> Path:
+    return Path(_data_dir_str(env_dir), "config.toml")
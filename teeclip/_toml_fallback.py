@@ -12,42 +12,48 @@ Only handles the subset of TOML that teeclip's config.toml uses:
 
 Does NOT handle: arrays, inline tables, multi-line strings, dotted keys,
 dates, floats, escape sequences, etc.
+
+Deliberately pure Python: teeclip ships no compiled extensions, and a
+config file is a few dozen lines, so per-line work is kept in C-level
+str methods (find, strip, isdecimal) rather than a native parser.
 """
 
+from functools import lru_cache
+
+# Bare values that map straight to a Python object (looked up lowercased)
+_LITERALS = {"true": True, "false": False, "": ""}
+_INT_CHARS = frozenset("0123456789+-")
+
 
 def loads(text: str) -> dict:
     """Parse a simple TOML string into a nested dict."""
     result = {}
-    current_section = None
+    section = None  # dict for the current [section]; root keys go in ""
+    strip_comment = _strip_inline_comment  # local names for the loop
+    parse_value = _parse_value
 
     for line in text.splitlines():
         stripped = line.strip()
 
         # Skip blank lines and comments
-        if not stripped or stripped.startswith("#"):
+        if not stripped or stripped[0] == "#":
             continue
 
         # Section header
-        if stripped.startswith("[") and stripped.endswith("]"):
-            current_section = stripped[1:-1].strip()
-            result.setdefault(current_section, {})
+        if stripped[0] == "[" and stripped[-1] == "]":
+            section = result.setdefault(stripped[1:-1].strip(), {})
             continue
 
         # Key = value
-        if "=" in stripped:
-            key, _, raw_value = stripped.partition("=")
-            key = key.strip()
-            raw_value = raw_value.strip()
+        eq = stripped.find("=")
+        if eq >= 0:
+            key = stripped[:eq].rstrip()
+            raw_value = stripped[eq + 1:].lstrip()
 
+            if section is None:
+                section = result.setdefault("", {})
             # Strip inline comments (but not inside quotes)
-            raw_value = _strip_inline_comment(raw_value)
-            value = _parse_value(raw_value)
-
-            if current_section:
-                result[current_section][key] = value
-            else:
-                result.setdefault("", {})
-                result[""][key] = value
+            section[key] = parse_value(strip_comment(raw_value))
 
     return result
 
@@ -59,9 +65,13 @@ def load(fp) -> dict:
 
 def _strip_inline_comment(raw: str) -> str:
     """Remove inline comments, respecting quoted strings."""
-    if not raw:
+    if "#" not in raw:
         return raw
 
+    # Common case: no quotes, so the first '#' starts the comment
+    if '"' not in raw and "'" not in raw:
+        return raw[:raw.find("#")].rstrip()
+
     in_quote = None
     for i, ch in enumerate(raw):
         if ch in ('"', "'") and in_quote is None:
@@ -74,10 +84,16 @@ def _strip_inline_comment(raw: str) -> str:
     return raw
 
 
+@lru_cache(maxsize=256)
 def _parse_value(raw: str) -> object:
-    """Parse a TOML value string into a Python object."""
-    if not raw:
-        return ""
+    """Parse a TOML value string into a Python object.
+
+    Cached: config values repeat heavily (true/false, small ints).
+    """
+    # Booleans and the empty value
+    value = _LITERALS.get(raw.lower())
+    if value is not None:
+        return value
 
     # Double-quoted string
     if raw.startswith('"') and raw.endswith('"') and len(raw) >= 2:
@@ -87,17 +103,14 @@ def _parse_value(raw: str) -> object:
     if raw.startswith("'") and raw.endswith("'") and len(raw) >= 2:
         return raw[1:-1]
 
-    # Booleans
-    if raw.lower() == "true":
-        return True
-    if raw.lower() == "false":
-        return False
-
-    # Integers
-    try:
-        return int(raw)
-    except ValueError:
-        pass
+    # Integers (checked up front rather than via int() + ValueError).
+    # TOML allows single underscores between digits, e.g. 1_000.
+    if raw[0] in _INT_CHARS:
+        digits = raw[1:] if raw[0] in "+-" else raw
+        if digits.isdecimal() or (
+            "_" in digits and all(p.isdecimal() for p in digits.split("_"))
+        ):
+            return int(raw)
 
     # Unquoted string fallback
     return raw
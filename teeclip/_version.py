@@ -31,6 +31,20 @@ __version__ = "0.2.2_main_9-20260218-8879256f"
 __app_name__ = "teeclip"
 
 
+# Split the build-annotated string once; the getters below and the
+# module-level constants all derive from these pieces.
+# MAJOR.MINOR.PATCH[-PHASE] _ BRANCH _ BUILD-YYYYMMDD-COMMITHASH
+_parts = __version__.split("_", 2)
+if len(_parts) > 1:
+    _BASE = _parts[0]
+else:
+    _BASE = f"{MAJOR}.{MINOR}.{PATCH}-{PHASE}" if PHASE else f"{MAJOR}.{MINOR}.{PATCH}"
+_BRANCH = _parts[1] if len(_parts) > 1 else None
+_BUILD_INFO = _parts[2] if len(_parts) > 2 else ""
+_BUILD_NUM = _BUILD_INFO.split("-", 1)[0] if "-" in _BUILD_INFO else "0"
+del _parts
+
+
 def get_version():
     """Return the full version string including branch and build info."""
     return __version__
@@ -41,20 +55,14 @@ def get_display_version():
 
     Example: 'PREALPHA 0.1.0-alpha' or 'BETA 0.5.1' or '1.0.0'
     """
-    base = get_base_version()
     if PROJECT_PHASE and PROJECT_PHASE != "stable":
-        return f"{PROJECT_PHASE.upper()} {base}"
-    return base
+        return f"{PROJECT_PHASE.upper()} {_BASE}"
+    return _BASE
 
 
 def get_base_version():
     """Return the semantic version string (MAJOR.MINOR.PATCH[-PHASE])."""
-    if "_" in __version__:
-        return __version__.split("_")[0]
-    base = f"{MAJOR}.{MINOR}.{PATCH}"
-    if PHASE:
-        base = f"{base}-{PHASE}"
-    return base
+    return _BASE
 
 
 def get_pip_version():
@@ -73,22 +81,13 @@ def get_pip_version():
     if PHASE:
         base += phase_map.get(PHASE, PHASE)
 
-    if "_" not in __version__:
-        return base
-
-    parts = __version__.split("_")
-    branch = parts[1] if len(parts) > 1 else "unknown"
-
-    if branch == "main":
+    if _BRANCH is None or _BRANCH == "main":
         return base
-    else:
-        build_info = "_".join(parts[2:]) if len(parts) > 2 else ""
-        build_num = build_info.split("-")[0] if "-" in build_info else "0"
-        return f"{base}.dev{build_num}"
+    return f"{base}.dev{_BUILD_NUM}"
 
 
 # For convenience in imports
-VERSION = get_version()
-BASE_VERSION = get_base_version()
+VERSION = __version__
+BASE_VERSION = _BASE
 PIP_VERSION = get_pip_version()
 DISPLAY_VERSION = get_display_version()
@@ -12,14 +12,41 @@ Usage:
     teeclip --version                 # show version
 """
 
-import argparse
+import io
+import os
 import sys
+from functools import lru_cache
 
+from ._fastargs import parse as _fast_parse
 from ._version import __version__, get_display_version
 
+_VERSION_STR = f"teeclip {get_display_version()} ({__version__})"
+
+_DESCRIPTION = (
+    "Like tee, but for the clipboard. "
+    "Reads stdin, writes to stdout and the system clipboard."
+)
+
+_EPILOG = (
+    "examples:\n"
+    "  echo hello | teeclip              # copy 'hello' to clipboard\n"
+    "  git diff | teeclip                # view diff AND copy to clipboard\n"
+    "  cat file | teeclip -a log.txt     # clipboard + append to log\n"
+    "  teeclip --paste                   # print clipboard contents\n"
+    "  teeclip --paste | grep error      # pipe clipboard into grep\n"
+    "  teeclip --list                    # show clipboard history\n"
+    "  teeclip --list 20                 # show last 20 entries\n"
+    "  teeclip --get 1                   # retrieve most recent clip\n"
+    "  teeclip --clear 3                 # delete entry #3\n"
+    "  teeclip --clear 4:10              # delete entries 4-10\n"
+    "  teeclip --clear 2,4:10            # delete entry 2 and 4-10\n"
+)
+
 
 def _list_arg(value):
     """Parse --list argument: integer or 'all' (returns -1)."""
+    import argparse
+
     if value.lower() == "all":
         return -1
     try:
@@ -33,29 +60,19 @@ def _list_arg(value):
     return n
 
 
-def build_parser() -> argparse.ArgumentParser:
+# Built once per process; parse_args() returns a fresh Namespace and leaves
+# the parser untouched.  Tests that need a fresh parser can call
+# build_parser.cache_clear().
+@lru_cache(maxsize=None)
+def build_parser() -> "argparse.ArgumentParser":
     """Build the argument parser."""
+    import argparse
+
     p = argparse.ArgumentParser(
         prog="teeclip",
-        description=(
-            "Like tee, but for the clipboard. "
-            "Reads stdin, writes to stdout and the system clipboard."
-        ),
+        description=_DESCRIPTION,
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=(
-            "examples:\n"
-            "  echo hello | teeclip              # copy 'hello' to clipboard\n"
-            "  git diff | teeclip                # view diff AND copy to clipboard\n"
-            "  cat file | teeclip -a log.txt     # clipboard + append to log\n"
-            "  teeclip --paste                   # print clipboard contents\n"
-            "  teeclip --paste | grep error      # pipe clipboard into grep\n"
-            "  teeclip --list                    # show clipboard history\n"
-            "  teeclip --list 20                 # show last 20 entries\n"
-            "  teeclip --get 1                   # retrieve most recent clip\n"
-            "  teeclip --clear 3                 # delete entry #3\n"
-            "  teeclip --clear 4:10              # delete entries 4-10\n"
-            "  teeclip --clear 2,4:10            # delete entry 2 and 4-10\n"
-        ),
+        epilog=_EPILOG,
     )
 
     p.add_argument(
@@ -163,133 +180,130 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument(
         "--version", "-V",
         action="version",
-        version=f"teeclip {get_display_version()} ({__version__})",
+        version=_VERSION_STR,
     )
 
     return p
 
 
+@lru_cache(maxsize=None)
+def _static_help() -> str:
+    """Return the full --help text, formatted once per process."""
+    return build_parser().format_help()
+
+
 def main(argv=None):
     """Main entry point.
 
-    Dispatch priority: config → clear → list → get → save → paste → tee.
+    Dispatch priority: config → encrypt → decrypt → clear → list → get →
+    save → paste → tee (see _DISPATCH).
     """
-    parser = build_parser()
-    args = parser.parse_args(argv)
-
-    # Load config and apply CLI overrides
-    from .config import load_config
-    config = load_config()
-    config = config.with_overrides(
-        output_quiet=args.quiet or None,
-        clipboard_backend=args.backend or None,
-    )
-
-    # --config: show effective configuration
-    if args.show_config:
-        _cmd_config(config)
-        return
+    if argv is None:
+        argv = sys.argv[1:]
 
-    # --encrypt / --decrypt
-    if args.encrypt:
-        _cmd_encrypt(config)
+    # Fast paths: --version, --help, and anything _fastargs can read
+    # exactly; only the leftovers pay for importing and building argparse.
+    if argv and argv[0] in ("-V", "--version"):
+        print(_VERSION_STR)
         return
-    if args.decrypt:
-        _cmd_decrypt(config)
-        return
-
-    # --clear: clear history (all or selective)
-    if args.clear_history is not None:
-        _cmd_clear(config, args.clear_history)
-        return
-
-    # --list [N]: show recent history (0 = use config default)
-    if args.list_history is not None:
-        count = args.list_history or config.history_list_count
-        _cmd_list(config, count)
-        return
-
-    # --get N: retrieve clip by index
-    if args.get_clip is not None:
-        _cmd_get(config, args.get_clip, backend_name=args.backend)
+    if argv and argv[0] in ("-h", "--help"):
+        sys.stdout.write(_static_help())
         return
+    args = _fast_parse(argv)
+    if args is None:
+        args = build_parser().parse_args(argv)
+
+    # First command flag that was given wins; otherwise tee stdin.
+    # config.toml is only read for commands that consult it.
+    for dest, handler, needs_config in _DISPATCH:
+        value = getattr(args, dest)
+        if value is not None and value is not False:
+            handler(_load_config(args) if needs_config else None, args)
+            return
 
-    # --save: save current clipboard to history
-    if args.save_clip:
-        _cmd_save(config, backend_name=args.backend)
-        return
+    if args.no_history and args.quiet:
+        # Pure tee: nothing in config.toml can change the outcome
+        from .config import Config
+        config = Config(output_quiet=True, clipboard_backend=args.backend or "")
+    else:
+        config = _load_config(args)
+    _cmd_tee(config, args)
 
-    # --paste mode: print clipboard to stdout
-    if args.paste:
-        from .clipboard import paste_from_clipboard, ClipboardError
-        try:
-            data = paste_from_clipboard(backend_name=args.backend)
-            sys.stdout.buffer.write(data)
-            sys.stdout.buffer.flush()
-        except ClipboardError as e:
-            print(f"teeclip: {e}", file=sys.stderr)
-            sys.exit(1)
-        return
 
-    # Default mode: tee stdin to stdout + clipboard + history
-    from .tee import tee_to_clipboard
-    history_enabled = config.history_enabled and config.history_auto_save and not args.no_history
-    tee_to_clipboard(
-        files=args.files or None,
-        append=args.append,
-        backend_name=args.backend,
-        quiet=config.output_quiet,
-        no_clipboard=args.no_clipboard,
-        save_history=history_enabled,
-        config=config,
+def _load_config(args):
+    """Load config.toml and apply CLI overrides."""
+    from .config import load_config
+    config = load_config()
+    if not (args.quiet or args.backend):
+        return config
+    return config.with_overrides(
+        output_quiet=args.quiet or None,
+        clipboard_backend=args.backend or None,
     )
 
 
-def _cmd_config(config):
+def _cmd_config(config, args):
     """Show effective configuration."""
     from .config import format_config
     print(format_config(config))
 
 
-def _cmd_list(config, limit):
-    """Show recent clipboard history."""
+def _cmd_list(config, args):
+    """Show recent clipboard history.
+
+    args.list_history is the entry count; 0 means use config list_count.
+    """
     from .history import HistoryStore, _make_preview
 
+    limit = args.list_history or config.history_list_count
+
     with HistoryStore(config=config) as store:
         total = store.count()
 
         if total == 0:
-            print("(no history)")
+            _write_text("(no history)\n")
             return
 
         entries = store.list_recent(limit=limit)
 
         # For OS auth, decrypt previews on the fly so --list is useful
-        decrypt_key = None
+        cipher = None
         if (config.security_auth_method != "password"
                 and any(e.encrypted for e in entries)):
             try:
                 from .encryption import (
                     is_available, get_encryption_key,
-                    decrypt as aes_decrypt,
+                    _new_cipher, _decrypt_with,
                 )
                 if is_available():
-                    decrypt_key = get_encryption_key(config, store)
+                    cipher = _new_cipher(get_encryption_key(config, store))
             except Exception:
                 pass  # fall back to showing "(encrypted)"
 
+        # Fetch all encrypted blobs in one query rather than one per row
+        encrypted_blobs = {}
+        if cipher is not None:
+            encrypted_blobs = store.get_clips_bulk(
+                [e.id for e in entries if e.encrypted]
+            )
+
+        rows = []
         for i, entry in enumerate(entries, 1):
             # Truncate timestamp to just date + time (drop timezone)
             ts = entry.timestamp
-            if "T" in ts:
-                ts = ts.split("T")[0] + " " + ts.split("T")[1][:8]
+            if len(ts) >= 19 and ts[10] == "T":
+                ts = ts[:10] + " " + ts[11:19]
+            else:
+                t = ts.find("T")
+                if t >= 0:
+                    ts = ts[:t] + " " + ts[t + 1:t + 9]
 
             preview = entry.preview or "(empty)"
-            if entry.encrypted and decrypt_key is not None:
+            if entry.encrypted and cipher is not None:
                 try:
-                    raw = store.get_clip(i)
+                    raw = encrypted_blobs.get(entry.id)
                     if raw:
-                        plaintext = aes_decrypt(raw, decrypt_key)
+                        plaintext = _decrypt_with(cipher, raw)
                         preview = _make_preview(
                             plaintext, config.history_preview_length
                         )
@@ -297,17 +311,23 @@ def _cmd_list(config, limit):
                     pass  # keep "(encrypted)" on failure
 
             enc = " [E]" if entry.encrypted else "    "
-            print(f"  {i:>3}  {ts}{enc}  {preview}")
+            rows.append(f"  {i:>3}  {ts}{enc}  {preview}")
 
         shown = len(entries)
         if shown < total:
-            print(f"  ({shown} of {total} entries -- use --list all to see everything)")
+            rows.append(f"  ({shown} of {total} entries -- use --list all to see everything)")
 
+        # One write for the whole listing instead of a print() per row
+        rows.append("")
+        _write_text("\n".join(rows))
 
-def _cmd_get(config, index, backend_name=None):
+
+def _cmd_get(config, args):
     """Retrieve clip by 1-based index, write to stdout and clipboard."""
     from .history import HistoryStore
 
+    index = args.get_clip
+
     with HistoryStore(config=config) as store:
         result = store.get_clip_entry(index)
 
@@ -326,26 +346,36 @@ def _cmd_get(config, index, backend_name=None):
                 print(f"teeclip: {e}", file=sys.stderr)
                 sys.exit(1)
 
-    # Write to stdout
-    sys.stdout.buffer.write(content)
-    sys.stdout.buffer.flush()
-
-    # Also copy to clipboard
+    # Copy to clipboard in the background while writing to stdout; the
+    # two are independent and both can be slow for large clips.
+    import threading
     from .clipboard import copy_to_clipboard, ClipboardError
+    clipboard_errors = []
+
+    def _copy():
+        try:
+            copy_to_clipboard(content, backend_name=args.backend)
+        except ClipboardError as e:
+            clipboard_errors.append(e)
+
+    copier = threading.Thread(target=_copy, daemon=True)
+    copier.start()
     try:
-        copy_to_clipboard(content, backend_name=backend_name)
-    except ClipboardError as e:
-        if not config.output_quiet:
-            print(f"\nteeclip: clipboard: {e}", file=sys.stderr)
+        _write_stdout(content)
+    finally:
+        copier.join()
+
+    if clipboard_errors and not config.output_quiet:
+        print(f"\nteeclip: clipboard: {clipboard_errors[0]}", file=sys.stderr)
 
 
-def _cmd_save(config, backend_name=None):
+def _cmd_save(config, args):
     """Save current clipboard contents to history."""
     from .clipboard import paste_from_clipboard, ClipboardError
     from .history import HistoryStore
 
     try:
-        data = paste_from_clipboard(backend_name=backend_name)
+        data = paste_from_clipboard(backend_name=args.backend)
     except ClipboardError as e:
         print(f"teeclip: {e}", file=sys.stderr)
         sys.exit(1)
@@ -365,13 +395,74 @@ def _cmd_save(config, backend_name=None):
             print("teeclip: already in history (duplicate)")
 
 
-def _cmd_clear(config, selector):
+def _cmd_paste(config, args):
+    """Print current clipboard contents to stdout (config is unused)."""
+    from .clipboard import paste_from_clipboard, ClipboardError
+    try:
+        data = paste_from_clipboard(backend_name=args.backend)
+        _write_stdout(data)
+    except ClipboardError as e:
+        print(f"teeclip: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+def _write_text(text: str) -> None:
+    """Encode text for stdout (unencodable chars become ?) and write it."""
+    encoding = getattr(sys.stdout, "encoding", None) or "utf-8"
+    _write_stdout(text.encode(encoding, "replace"))
+
+
+def _write_stdout(data: bytes) -> None:
+    """Write a one-shot blob to stdout.
+
+    When stdout is a pipe or file, write straight to the OS file
+    descriptor so large blobs skip the BufferedWriter copy.  Terminals
+    (which on Windows need the console layer's encoding) and stdout
+    replacements without a real fd (pytest capture, IDEs) use the
+    regular buffered path.
+    """
+    try:
+        fd = sys.stdout.fileno()
+        direct = not sys.stdout.isatty()
+    except (AttributeError, ValueError, io.UnsupportedOperation):
+        direct = False
+
+    if not direct:
+        sys.stdout.buffer.write(data)
+        sys.stdout.buffer.flush()
+        return
+
+    sys.stdout.flush()  # keep anything already buffered in order
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _cmd_tee(config, args):
+    """Default mode: tee stdin to stdout + clipboard + history."""
+    from .tee import tee_to_clipboard
+    history_enabled = config.history_enabled and config.history_auto_save and not args.no_history
+    tee_to_clipboard(
+        files=args.files or None,
+        append=args.append,
+        backend_name=args.backend,
+        quiet=config.output_quiet,
+        no_clipboard=args.no_clipboard,
+        save_history=history_enabled,
+        config=config,
+    )
+
+
+def _cmd_clear(config, args):
     """Clear clipboard history — all or selective.
 
-    selector is "all" (no arg) or a string like "3", "4:10", "2,4:10".
+    args.clear_history is "all" (no arg) or a string like "3", "4:10",
+    "2,4:10".
     """
     from .history import HistoryStore
 
+    selector = args.clear_history
+
     if selector == "all":
         # Clear everything — prompt for confirmation if interactive
         if sys.stdin.isatty():
@@ -392,18 +483,22 @@ def _cmd_clear(config, selector):
 
     # Selective deletion
     try:
-        indices = parse_clear_selector(selector)
+        ranges = parse_clear_ranges(selector)
     except ValueError as e:
         print(f"teeclip: {e}", file=sys.stderr)
         sys.exit(1)
 
     with HistoryStore(config=config) as store:
-        count = store.delete_by_indices(indices)
+        count = store.delete_by_ranges(ranges)
 
     if not config.output_quiet:
         print(f"teeclip: deleted {count} entries")
 
 
+# N or N:M; anything else takes the slow path for its error message
+_SELECTOR_PART = r"(\d+)(?::(\d+))?"
+
+
 def parse_clear_selector(selector: str) -> list:
     """Parse a clear selector string into a sorted list of 1-based indices.
 
@@ -415,49 +510,86 @@ def parse_clear_selector(selector: str) -> list:
 
     Raises ValueError on invalid syntax.
     """
-    indices = set()
+    indices = []
+    for lo, hi in parse_clear_ranges(selector):
+        indices.extend(range(lo, hi + 1))
+    return indices
+
+
+def parse_clear_ranges(selector: str) -> list:
+    """Parse a clear selector into sorted, disjoint (start, end) ranges.
+
+    Like parse_clear_selector() but without expanding the ranges, so
+    "1:1000000" stays one tuple: "2,4:10,5:12" → [(2, 2), (4, 12)].
+
+    Raises ValueError on invalid syntax.
+    """
+    import re
+
+    match = re.compile(_SELECTOR_PART, re.ASCII).fullmatch
+    pairs = []
     for part in selector.split(","):
         part = part.strip()
         if not part:
             continue
-        if ":" in part:
-            pieces = part.split(":", 1)
-            try:
-                start = int(pieces[0])
-                end = int(pieces[1])
-            except ValueError:
-                raise ValueError(
-                    f"invalid range: '{part}' (expected START:END)"
-                )
-            if start < 1 or end < 1:
-                raise ValueError(
-                    f"indices must be positive: '{part}'"
-                )
-            if start > end:
-                raise ValueError(
-                    f"invalid range: '{part}' (start > end)"
-                )
-            indices.update(range(start, end + 1))
+        m = match(part)
+        if m is not None:
+            lo = int(m.group(1))
+            hi = int(m.group(2) or lo)
         else:
-            try:
-                idx = int(part)
-            except ValueError:
-                raise ValueError(
-                    f"invalid index: '{part}' (expected a number)"
-                )
-            if idx < 1:
-                raise ValueError(
-                    f"indices must be positive: '{part}'"
-                )
-            indices.add(idx)
-
-    if not indices:
+            lo, hi = _parse_selector_part(part)
+        if lo < 1 or hi < 1:
+            raise ValueError(f"indices must be positive: '{part}'")
+        if lo > hi:
+            raise ValueError(f"invalid range: '{part}' (start > end)")
+        pairs.append((lo, hi))
+
+    if not pairs:
         raise ValueError("empty selector")
 
-    return sorted(indices)
+    # Merge overlapping/adjacent ranges; the list is per comma part, not
+    # per index, so sorting it is trivial
+    pairs.sort()
+    merged = [pairs[0]]
+    for lo, hi in pairs[1:]:
+        last_lo, last_hi = merged[-1]
+        if lo <= last_hi + 1:
+            if hi > last_hi:
+                merged[-1] = (last_lo, hi)
+        else:
+            merged.append((lo, hi))
+    return merged
+
+
+def _parse_selector_part(part: str) -> tuple:
+    """Slow path for selector parts the regex rejects (signs, bad input).
+
+    Returns (start, end) or raises ValueError with a user-facing message.
+    """
+    if ":" in part:
+        pieces = part.split(":", 1)
+        try:
+            start = int(pieces[0])
+            end = int(pieces[1])
+        except ValueError:
+            raise ValueError(
+                f"invalid range: '{part}' (expected START:END)"
+            )
+        if start < 1 or end < 1:
+            raise ValueError(
+                f"indices must be positive: '{part}'"
+            )
+        return start, end
+    try:
+        idx = int(part)
+    except ValueError:
+        raise ValueError(
+            f"invalid index: '{part}' (expected a number)"
+        )
+    return idx, idx
 
 
-def _cmd_encrypt(config):
+def _cmd_encrypt(config, args):
     """Enable encryption for clipboard history."""
     from .encryption import (
         is_available, EncryptionError,
@@ -495,7 +627,7 @@ def _cmd_encrypt(config):
         print("teeclip: new clips will be encrypted automatically")
 
 
-def _cmd_decrypt(config):
+def _cmd_decrypt(config, args):
     """Disable encryption and decrypt existing history."""
     from .encryption import (
         is_available, EncryptionError,
@@ -530,5 +662,20 @@ def _cmd_decrypt(config):
         print(f"teeclip: decrypted {count} clips")
 
 
+# Command flags in priority order: (args attribute, handler, needs_config).
+# A flag counts as given when its value is anything but None/False, so
+# `--list` (parsed as 0) and `--get 0` still dispatch.  Handlers that
+# don't need config receive None and skip reading config.toml.
+_DISPATCH = (
+    ("show_config", _cmd_config, True),
+    ("encrypt", _cmd_encrypt, True),
+    ("decrypt", _cmd_decrypt, True),
+    ("clear_history", _cmd_clear, True),
+    ("list_history", _cmd_list, True),
+    ("get_clip", _cmd_get, True),
+    ("save_clip", _cmd_save, True),
+    ("paste", _cmd_paste, False),
+)
+
 if __name__ == "__main__":
     main()
@@ -2,13 +2,14 @@
 Cross-platform clipboard abstraction.
 
 Auto-detects the platform and uses native OS clipboard commands:
-- Windows: clip.exe (write), PowerShell Get-Clipboard (read)
+- Windows: clip.exe (write), Win32 API or PowerShell Get-Clipboard (read)
 - macOS: pbcopy (write), pbpaste (read)
 - Linux/X11: xclip or xsel
 - Linux/Wayland: wl-copy, wl-paste
 - WSL: Windows clipboard tools via /mnt/c/
 
-No Python dependencies required — uses subprocess calls to native tools.
+No Python dependencies required — uses subprocess calls to native tools
+(plus ctypes for reading on native Windows).
 """
 
 import os
@@ -16,6 +17,7 @@ import platform
 import shutil
 import subprocess
 import sys
+from functools import lru_cache
 
 
 class ClipboardError(Exception):
@@ -29,6 +31,7 @@ class ClipboardBackend:
     name = "base"
 
     def copy(self, data: bytes) -> None:
+        """Copy data (bytes-like, or an iterable of chunks) to the clipboard."""
         raise NotImplementedError
 
     def paste(self) -> bytes:
@@ -45,30 +48,20 @@ class WindowsBackend(ClipboardBackend):
     name = "windows"
 
     def copy(self, data: bytes) -> None:
-        try:
-            proc = subprocess.run(
-                ["clip.exe"],
-                input=data,
-                capture_output=True,
-                timeout=10,
-            )
-            if proc.returncode != 0:
-                raise ClipboardError(f"clip.exe failed: {proc.stderr.decode(errors='replace')}")
-        except FileNotFoundError:
-            raise ClipboardError("clip.exe not found")
+        _exec(["clip.exe"], data, label="clip.exe failed", missing="clip.exe not found")
 
     def paste(self) -> bytes:
-        try:
-            proc = subprocess.run(
-                ["powershell.exe", "-NoProfile", "-Command", "Get-Clipboard -Raw"],
-                capture_output=True,
-                timeout=10,
-            )
-            if proc.returncode != 0:
-                raise ClipboardError(f"PowerShell Get-Clipboard failed: {proc.stderr.decode(errors='replace')}")
-            return proc.stdout
-        except FileNotFoundError:
-            raise ClipboardError("powershell.exe not found")
+        # Native Windows can read the clipboard in-process; PowerShell
+        # (slow to start) is the fallback, and the only option under WSL.
+        if sys.platform == "win32":
+            data = _win32_paste()
+            if data is not None:
+                return data
+        return _exec(
+            ["powershell.exe", "-NoProfile", "-Command", "Get-Clipboard -Raw"],
+            label="PowerShell Get-Clipboard failed",
+            missing="powershell.exe not found",
+        )
 
     @staticmethod
     def available() -> bool:
@@ -81,30 +74,10 @@ class MacBackend(ClipboardBackend):
     name = "macos"
 
     def copy(self, data: bytes) -> None:
-        try:
-            proc = subprocess.run(
-                ["pbcopy"],
-                input=data,
-                capture_output=True,
-                timeout=10,
-            )
-            if proc.returncode != 0:
-                raise ClipboardError(f"pbcopy failed: {proc.stderr.decode(errors='replace')}")
-        except FileNotFoundError:
-            raise ClipboardError("pbcopy not found")
+        _exec(["pbcopy"], data, label="pbcopy failed", missing="pbcopy not found")
 
     def paste(self) -> bytes:
-        try:
-            proc = subprocess.run(
-                ["pbpaste"],
-                capture_output=True,
-                timeout=10,
-            )
-            if proc.returncode != 0:
-                raise ClipboardError(f"pbpaste failed: {proc.stderr.decode(errors='replace')}")
-            return proc.stdout
-        except FileNotFoundError:
-            raise ClipboardError("pbpaste not found")
+        return _exec(["pbpaste"], label="pbpaste failed", missing="pbpaste not found")
 
     @staticmethod
     def available() -> bool:
@@ -117,34 +90,22 @@ class XclipBackend(ClipboardBackend):
     name = "xclip"
 
     def copy(self, data: bytes) -> None:
-        try:
-            proc = subprocess.run(
-                ["xclip", "-selection", "clipboard"],
-                input=data,
-                capture_output=True,
-                timeout=10,
-            )
-            if proc.returncode != 0:
-                raise ClipboardError(f"xclip failed: {proc.stderr.decode(errors='replace')}")
-        except FileNotFoundError:
-            raise ClipboardError("xclip not found — install with: sudo apt install xclip")
+        _exec(
+            ["xclip", "-selection", "clipboard"], data,
+            label="xclip failed",
+            missing="xclip not found — install with: sudo apt install xclip",
+        )
 
     def paste(self) -> bytes:
-        try:
-            proc = subprocess.run(
-                ["xclip", "-selection", "clipboard", "-o"],
-                capture_output=True,
-                timeout=10,
-            )
-            if proc.returncode != 0:
-                raise ClipboardError(f"xclip failed: {proc.stderr.decode(errors='replace')}")
-            return proc.stdout
-        except FileNotFoundError:
-            raise ClipboardError("xclip not found — install with: sudo apt install xclip")
+        return _exec(
+            ["xclip", "-selection", "clipboard", "-o"],
+            label="xclip failed",
+            missing="xclip not found — install with: sudo apt install xclip",
+        )
 
     @staticmethod
     def available() -> bool:
-        return shutil.which("xclip") is not None
+        return _has_tool("xclip")
 
 
 class XselBackend(ClipboardBackend):
@@ -153,34 +114,22 @@ class XselBackend(ClipboardBackend):
     name = "xsel"
 
     def copy(self, data: bytes) -> None:
-        try:
-            proc = subprocess.run(
-                ["xsel", "--clipboard", "--input"],
-                input=data,
-                capture_output=True,
-                timeout=10,
-            )
-            if proc.returncode != 0:
-                raise ClipboardError(f"xsel failed: {proc.stderr.decode(errors='replace')}")
-        except FileNotFoundError:
-            raise ClipboardError("xsel not found — install with: sudo apt install xsel")
+        _exec(
+            ["xsel", "--clipboard", "--input"], data,
+            label="xsel failed",
+            missing="xsel not found — install with: sudo apt install xsel",
+        )
 
     def paste(self) -> bytes:
-        try:
-            proc = subprocess.run(
-                ["xsel", "--clipboard", "--output"],
-                capture_output=True,
-                timeout=10,
-            )
-            if proc.returncode != 0:
-                raise ClipboardError(f"xsel failed: {proc.stderr.decode(errors='replace')}")
-            return proc.stdout
-        except FileNotFoundError:
-            raise ClipboardError("xsel not found — install with: sudo apt install xsel")
+        return _exec(
+            ["xsel", "--clipboard", "--output"],
+            label="xsel failed",
+            missing="xsel not found — install with: sudo apt install xsel",
+        )
 
     @staticmethod
     def available() -> bool:
-        return shutil.which("xsel") is not None
+        return _has_tool("xsel")
 
 
 class WaylandBackend(ClipboardBackend):
@@ -189,34 +138,22 @@ class WaylandBackend(ClipboardBackend):
     name = "wayland"
 
     def copy(self, data: bytes) -> None:
-        try:
-            proc = subprocess.run(
-                ["wl-copy"],
-                input=data,
-                capture_output=True,
-                timeout=10,
-            )
-            if proc.returncode != 0:
-                raise ClipboardError(f"wl-copy failed: {proc.stderr.decode(errors='replace')}")
-        except FileNotFoundError:
-            raise ClipboardError("wl-copy not found — install with: sudo apt install wl-clipboard")
+        _exec(
+            ["wl-copy"], data,
+            label="wl-copy failed",
+            missing="wl-copy not found — install with: sudo apt install wl-clipboard",
+        )
 
     def paste(self) -> bytes:
-        try:
-            proc = subprocess.run(
-                ["wl-paste"],
-                capture_output=True,
-                timeout=10,
-            )
-            if proc.returncode != 0:
-                raise ClipboardError(f"wl-paste failed: {proc.stderr.decode(errors='replace')}")
-            return proc.stdout
-        except FileNotFoundError:
-            raise ClipboardError("wl-paste not found — install with: sudo apt install wl-clipboard")
+        return _exec(
+            ["wl-paste"],
+            label="wl-paste failed",
+            missing="wl-paste not found — install with: sudo apt install wl-clipboard",
+        )
 
     @staticmethod
     def available() -> bool:
-        return os.environ.get("WAYLAND_DISPLAY") and shutil.which("wl-copy") is not None
+        return os.environ.get("WAYLAND_DISPLAY") and _has_tool("wl-copy")
 
 
 class WSLBackend(ClipboardBackend):
@@ -227,14 +164,14 @@ class WSLBackend(ClipboardBackend):
     def _find_clip(self):
         """Find clip.exe in WSL environment."""
         for path in ["/mnt/c/Windows/System32/clip.exe", "clip.exe"]:
-            if shutil.which(path) or os.path.isfile(path):
+            if _has_tool(path) or os.path.isfile(path):
                 return path
         return None
 
     def _find_powershell(self):
         """Find powershell.exe in WSL environment."""
         for path in ["/mnt/c/Windows/System32/WindowsPowerShell/v1.0/powershell.exe", "powershell.exe"]:
-            if shutil.which(path) or os.path.isfile(path):
+            if _has_tool(path) or os.path.isfile(path):
                 return path
         return None
 
@@ -242,50 +179,206 @@ class WSLBackend(ClipboardBackend):
         clip = self._find_clip()
         if not clip:
             raise ClipboardError("clip.exe not found in WSL environment")
-        try:
-            proc = subprocess.run(
-                [clip],
-                input=data,
-                capture_output=True,
-                timeout=10,
-            )
-            if proc.returncode != 0:
-                raise ClipboardError(f"clip.exe failed: {proc.stderr.decode(errors='replace')}")
-        except FileNotFoundError:
-            raise ClipboardError("clip.exe not found in WSL environment")
+        _exec(
+            [clip], data,
+            label="clip.exe failed",
+            missing="clip.exe not found in WSL environment",
+        )
 
     def paste(self) -> bytes:
         ps = self._find_powershell()
         if not ps:
             raise ClipboardError("powershell.exe not found in WSL environment")
-        try:
-            proc = subprocess.run(
-                [ps, "-NoProfile", "-Command", "Get-Clipboard -Raw"],
-                capture_output=True,
-                timeout=10,
-            )
-            if proc.returncode != 0:
-                raise ClipboardError(f"PowerShell failed: {proc.stderr.decode(errors='replace')}")
-            return proc.stdout
-        except FileNotFoundError:
-            raise ClipboardError("powershell.exe not found in WSL environment")
+        return _exec(
+            [ps, "-NoProfile", "-Command", "Get-Clipboard -Raw"],
+            label="PowerShell failed",
+            missing="powershell.exe not found in WSL environment",
+        )
 
     @staticmethod
     def available() -> bool:
         return _is_wsl()
 
 
+_CF_UNICODETEXT = 13
+
+
+def _win32_paste():
+    """Read clipboard text through the Win32 API, as UTF-8 bytes.
+
+    Returns b"" when the clipboard holds no text, and None when the
+    clipboard cannot be opened (e.g. another process holds it) so the
+    caller can fall back to PowerShell.
+    """
+    import ctypes
+    from ctypes import wintypes
+
+    user32 = ctypes.WinDLL("user32")
+    kernel32 = ctypes.WinDLL("kernel32")
+    user32.OpenClipboard.argtypes = [wintypes.HWND]
+    user32.GetClipboardData.argtypes = [wintypes.UINT]
+    user32.GetClipboardData.restype = wintypes.HANDLE
+    kernel32.GlobalLock.argtypes = [wintypes.HGLOBAL]
+    kernel32.GlobalLock.restype = wintypes.LPVOID
+    kernel32.GlobalUnlock.argtypes = [wintypes.HGLOBAL]
+
+    if not user32.OpenClipboard(None):
+        return None
+    try:
+        handle = user32.GetClipboardData(_CF_UNICODETEXT)
+        if not handle:
+            return b""
+        ptr = kernel32.GlobalLock(handle)
+        if not ptr:
+            return None
+        try:
+            text = ctypes.wstring_at(ptr)
+        finally:
+            kernel32.GlobalUnlock(handle)
+    finally:
+        user32.CloseClipboard()
+    return text.encode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def _has_tool(cmd: str) -> bool:
+    """Return True if cmd resolves on PATH (cached; PATH walks are costly)."""
+    return shutil.which(cmd) is not None
+
+
+@lru_cache(maxsize=1)
 def _is_wsl() -> bool:
     """Detect if running inside Windows Subsystem for Linux."""
     if platform.system() != "Linux":
         return False
     try:
-        with open("/proc/version", "r") as f:
-            return "microsoft" in f.read().lower()
+        with open("/proc/version", "rb") as f:
+            return b"microsoft" in f.read().lower()
     except (FileNotFoundError, PermissionError):
         return False
 
 
+def _exec(argv: list, data=None, *, label: str, missing: str) -> bytes:
+    """Run a clipboard tool, mapping failures to ClipboardError.
+
+    Returns the tool's stdout (empty for writers).  label prefixes the
+    error when the tool exits non-zero; missing is the message used when
+    the executable cannot be found.
+    """
+    try:
+        returncode, stdout, stderr = _run_clip(argv, data)
+    except FileNotFoundError:
+        raise ClipboardError(missing)
+    if returncode != 0:
+        raise ClipboardError(f"{label}: {stderr.decode(errors='replace')}")
+    return stdout
+
+
+_TIMEOUT = 10  # seconds
+
+# Tools are run one-shot on purpose.  Every teeclip invocation performs at
+# most one clipboard operation (tee/--get/--save copy, --paste/--save read),
+# so a warm helper process would never see a second request and would only
+# add spawn/teardown bookkeeping.
+
+# Payloads at least this large are fed to the tool by a writer thread in
+# big os.write() calls instead of communicate()'s PIPE_BUF-sized writes.
+_DIRECT_WRITE_MIN = 64 * 1024
+
+
+def _run_clip(argv: list, data=None) -> tuple:
+    """Run a clipboard tool and return (returncode, stdout, stderr).
+
+    With data, the tool is a writer: data goes to its stdin and its
+    stdout is discarded.  data may be bytes-like or an iterable of
+    bytes-like chunks, which are written in order without being joined.
+    Without data, the tool is a reader: stdin is closed and stdout is
+    captured.  Only the pipes actually needed are created.  Raises
+    FileNotFoundError if the tool is missing and
+    subprocess.TimeoutExpired (after killing it) if it hangs.
+    """
+    writer = data is not None
+    chunks = None
+    if writer:
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            if len(data) >= _DIRECT_WRITE_MIN:
+                chunks = (data,)
+        else:
+            chunks = list(data)
+            if sum(map(len, chunks)) < _DIRECT_WRITE_MIN:
+                data = b"".join(chunks)
+                chunks = None
+
+    proc = subprocess.Popen(
+        argv,
+        stdin=subprocess.PIPE if writer else subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL if writer else subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    with proc:
+        # communicate() only ever drains stderr (and enforces the timeout);
+        # stdin/stdout are owned by a helper thread when one is used.
+        helper = None
+        captured = None
+        if chunks is not None:
+            helper = _start_thread(_feed_pipe, proc.stdin, chunks)
+            proc.stdin = None
+            data = None
+        elif not writer:
+            captured = bytearray()
+            helper = _start_thread(_drain_pipe, proc.stdout, captured)
+            proc.stdout = None
+        try:
+            _, stderr = proc.communicate(data, timeout=_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            raise
+        finally:
+            if helper is not None:
+                helper.join()
+    return proc.returncode, bytes(captured or b""), stderr
+
+
+def _start_thread(target, *args):
+    """Run target(*args) on a started daemon thread and return the thread."""
+    import threading
+
+    thread = threading.Thread(target=target, args=args, daemon=True)
+    thread.start()
+    return thread
+
+
+def _feed_pipe(pipe, chunks) -> None:
+    """Write chunks straight to pipe's fd, then close it."""
+    fd = pipe.fileno()
+    try:
+        for chunk in chunks:
+            view = memoryview(chunk).cast("B")
+            while view:
+                view = view[os.write(fd, view):]
+    except OSError:
+        pass  # tool exited early; its exit status says why
+    finally:
+        pipe.close()
+
+
+def _drain_pipe(pipe, out: bytearray) -> None:
+    """Read pipe to EOF into out through one reusable 64 KiB buffer."""
+    buf = bytearray(64 * 1024)
+    view = memoryview(buf)
+    readinto = pipe.raw.readinto
+    try:
+        while True:
+            n = readinto(view)
+            if not n:
+                break
+            out += view[:n]
+    finally:
+        view.release()
+        pipe.close()
+
+
 # Backend detection order — most specific first
 _BACKENDS = [
     WSLBackend,
@@ -296,9 +389,17 @@ _BACKENDS = [
     XselBackend,
 ]
 
+_BACKENDS_BY_NAME = {cls.name: cls for cls in _BACKENDS}
+_BACKEND_NAMES = ", ".join(_BACKENDS_BY_NAME)
 
+
+@lru_cache(maxsize=1)
 def detect_backend() -> ClipboardBackend:
-    """Auto-detect and return the appropriate clipboard backend."""
+    """Auto-detect and return the appropriate clipboard backend.
+
+    The result is cached for the life of the process; call
+    ``detect_backend.cache_clear()`` to force re-detection.
+    """
     for backend_cls in _BACKENDS:
         if backend_cls.available():
             return backend_cls()
@@ -313,14 +414,12 @@ def get_backend(name: str = None) -> ClipboardBackend:
     if name is None:
         return detect_backend()
 
-    for backend_cls in _BACKENDS:
-        if backend_cls.name == name:
-            if not backend_cls.available():
-                raise ClipboardError(f"Backend '{name}' is not available on this system")
-            return backend_cls()
-
-    available_names = [b.name for b in _BACKENDS]
-    raise ClipboardError(f"Unknown backend '{name}'. Available: {', '.join(available_names)}")
+    backend_cls = _BACKENDS_BY_NAME.get(name)
+    if backend_cls is None:
+        raise ClipboardError(f"Unknown backend '{name}'. Available: {_BACKEND_NAMES}")
+    if not backend_cls.available():
+        raise ClipboardError(f"Backend '{name}' is not available on this system")
+    return backend_cls()
 
 
 def copy_to_clipboard(data: bytes, backend_name: str = None) -> None:
@@ -36,7 +36,11 @@ _DEFAULTS = {
 }
 
 
-@dataclasses.dataclass(frozen=True)
+# Slotted instances (3.10+) skip the per-instance __dict__
+_DATACLASS_OPTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclasses.dataclass(frozen=True, **_DATACLASS_OPTS)
 class Config:
     """Immutable configuration object."""
 
@@ -56,8 +60,13 @@ class Config:
         Only applies overrides for non-None values, so CLI flags
         that weren't specified don't clobber config file values.
         """
+        for value in kwargs.values():
+            if value is not None:
+                break
+        else:
+            return self
         updates = {k: v for k, v in kwargs.items() if v is not None}
-        return dataclasses.replace(self, **updates) if updates else self
+        return dataclasses.replace(self, **updates)
 
 
 def load_config(config_path: Optional[Path] = None) -> Config:
@@ -91,8 +100,16 @@ def load_config(config_path: Optional[Path] = None) -> Config:
 
 
 def _parse_toml(text: str) -> dict:
-    """Parse TOML text using tomllib (3.11+) or fallback parser."""
+    """Parse TOML text using tomllib (3.11+) or fallback parser.
+
+    Plain config files (sections of bare keys with string, bool, or int
+    values) are read by _scan_simple_toml(), which costs far less than
+    importing tomllib; anything else goes to the full parser.
+    """
     if sys.version_info >= (3, 11):
+        parsed = _scan_simple_toml(text)
+        if parsed is not None:
+            return parsed
         import tomllib
         return tomllib.loads(text)
     else:
@@ -100,60 +117,149 @@ def _parse_toml(text: str) -> dict:
         return loads(text)
 
 
+_BARE_KEY_CHARS = frozenset(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_-"
+)
+
+
+def _scan_simple_toml(text: str) -> Optional[dict]:
+    """Parse the plain subset of TOML that config.toml normally uses.
+
+    Accepts [section] headers, bare keys, and basic strings without
+    escapes, literal strings, true/false, and decimal integers, plus
+    comments.  Returns None for anything else, including input tomllib
+    would reject (duplicate keys, root-level keys), so the caller can
+    hand it to tomllib for the authoritative result or error.
+    """
+    result = {}
+    section = None
+    bare = _BARE_KEY_CHARS
+
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped[0] == "#":
+            continue
+
+        if stripped[0] == "[":
+            end = stripped.find("]")
+            rest = stripped[end + 1:].lstrip()
+            name = stripped[1:end].strip()
+            if (end < 0 or (rest and rest[0] != "#") or not name
+                    or not bare.issuperset(name) or name in result):
+                return None
+            section = result[name] = {}
+            continue
+
+        eq = stripped.find("=")
+        key = stripped[:eq].rstrip()
+        if eq <= 0 or section is None or not bare.issuperset(key) or key in section:
+            return None
+        value = _scan_simple_value(stripped[eq + 1:].lstrip())
+        if value is None:
+            return None
+        section[key] = value
+
+    return result
+
+
+def _scan_simple_value(raw: str):
+    """Parse one value for _scan_simple_toml(), or return None."""
+    if raw[:1] in ('"', "'"):
+        quote = raw[0]
+        close = raw.find(quote, 1)
+        if close < 0:
+            return None
+        value = raw[1:close]
+        rest = raw[close + 1:].lstrip()
+        if (quote == '"' and "\\" in value) or (rest and rest[0] != "#"):
+            return None
+        return value
+
+    hash_at = raw.find("#")
+    if hash_at >= 0:
+        raw = raw[:hash_at].rstrip()
+    if raw == "true":
+        return True
+    if raw == "false":
+        return False
+
+    # Decimal integer: optional sign, no leading zeros, single underscores
+    digits = raw[1:] if raw[:1] in ("+", "-") else raw
+    parts = digits.split("_")
+    if (digits and all(p.isdigit() and p.isascii() for p in parts)
+            and (digits[0] != "0" or digits == "0")):
+        return int(raw)
+    return None
+
+
+def _to_bool(val, default):
+    if isinstance(val, str):
+        return val.lower() in ("true", "1", "yes")
+    return bool(val)
+
+
+def _to_int(val, default):
+    try:
+        return int(val)
+    except (ValueError, TypeError):
+        return default
+
+
+def _as_is(val, default):
+    return val
+
+
+_COERCERS = {bool: _to_bool, int: _to_int, str: _as_is}
+
+# (Config field, section, key, default, coercer), flattened from _DEFAULTS
+_FIELDS = tuple(
+    (f"{section}_{key}", section, key, default, _COERCERS[type(default)])
+    for section, keys in _DEFAULTS.items()
+    for key, default in keys.items()
+)
+
+_EMPTY = {}
+
+
 def _build_config(parsed: dict) -> Config:
     """Build a Config from parsed TOML dict, using defaults for missing keys."""
-    def _get(section: str, key: str, default):
-        val = parsed.get(section, {}).get(key, default)
-        # Type coercion for safety
-        if isinstance(default, bool):
-            if isinstance(val, str):
-                return val.lower() in ("true", "1", "yes")
-            return bool(val)
-        if isinstance(default, int) and not isinstance(default, bool):
-            try:
-                return int(val)
-            except (ValueError, TypeError):
-                return default
-        return val
-
-    return Config(
-        history_enabled=_get("history", "enabled", _DEFAULTS["history"]["enabled"]),
-        history_max_entries=_get("history", "max_entries", _DEFAULTS["history"]["max_entries"]),
-        history_auto_save=_get("history", "auto_save", _DEFAULTS["history"]["auto_save"]),
-        history_preview_length=_get("history", "preview_length", _DEFAULTS["history"]["preview_length"]),
-        history_list_count=_get("history", "list_count", _DEFAULTS["history"]["list_count"]),
-        clipboard_backend=_get("clipboard", "backend", _DEFAULTS["clipboard"]["backend"]),
-        output_quiet=_get("output", "quiet", _DEFAULTS["output"]["quiet"]),
-        security_encryption=_get("security", "encryption", _DEFAULTS["security"]["encryption"]),
-        security_auth_method=_get("security", "auth_method", _DEFAULTS["security"]["auth_method"]),
-    )
+    kwargs = {}
+    for field, section, key, default, coerce in _FIELDS:
+        table = parsed.get(section) or _EMPTY
+        kwargs[field] = coerce(table.get(key, default), default)
+    return Config(**kwargs)
 
 
 def format_config(config: Config, config_path: Optional[Path] = None) -> str:
     """Format config for display (used by --config flag)."""
     path = config_path or get_config_path()
-    lines = [
-        f"Config file: {path}",
-        f"  exists: {'yes' if path.is_file() else 'no'}",
-        "",
-        "[history]",
-        f"  enabled = {str(config.history_enabled).lower()}",
-        f"  max_entries = {config.history_max_entries}",
-        f"  auto_save = {str(config.history_auto_save).lower()}",
-        f"  preview_length = {config.history_preview_length}",
-        f"  list_count = {config.history_list_count}",
-        "",
-        "[clipboard]",
-        f"  backend = {config.clipboard_backend or '(auto)'}",
-        "",
-        "[output]",
-        f"  quiet = {str(config.output_quiet).lower()}",
-        "",
-        "[security]",
-        f"  encryption = {config.security_encryption}",
-        f"  auth_method = {config.security_auth_method}",
-    ]
-    return "\n".join(lines)
+    exists = "yes" if path.is_file() else "no"
+    return (
+        f"Config file: {path}\n"
+        f"  exists: {exists}\n"
+        f"\n"
+        f"[history]\n"
+        f"  enabled = {_bool_str(config.history_enabled)}\n"
+        f"  max_entries = {config.history_max_entries}\n"
+        f"  auto_save = {_bool_str(config.history_auto_save)}\n"
+        f"  preview_length = {config.history_preview_length}\n"
+        f"  list_count = {config.history_list_count}\n"
+        f"\n"
+        f"[clipboard]\n"
+        f"  backend = {config.clipboard_backend or '(auto)'}\n"
+        f"\n"
+        f"[output]\n"
+        f"  quiet = {_bool_str(config.output_quiet)}\n"
+        f"\n"
+        f"[security]\n"
+        f"  encryption = {config.security_encryption}\n"
+        f"  auth_method = {config.security_auth_method}"
+    )
+
+
+def _bool_str(value) -> str:
+    """Render a bool the way TOML spells it."""
+    return "true" if value else "false"
 
 
 def _warn(msg: str) -> None:
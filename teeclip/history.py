@@ -16,7 +16,8 @@ from typing import List, Optional, Tuple
 from ._paths import get_history_db_path, ensure_data_dir
 from .config import Config
 
-_CURRENT_SCHEMA_VERSION = 2
+_CURRENT_SCHEMA_VERSION = 6
+_MAX_SQL_PARAMS = 500
 
 
 class HistoryError(Exception):
@@ -61,7 +62,13 @@ class HistoryStore:
         self._conn = sqlite3.connect(str(self._db_path), timeout=10)
         self._conn.row_factory = sqlite3.Row
         self._conn.execute("PRAGMA journal_mode=WAL")
+        # In WAL mode NORMAL stays crash-safe; it only skips the fsync
+        # on each commit (a power loss may drop the last few saves)
+        self._conn.execute("PRAGMA synchronous=NORMAL")
         self._conn.execute("PRAGMA foreign_keys=ON")
+        # Zero deleted clip content in place, so deletes scrub without
+        # needing a full VACUUM
+        self._conn.execute("PRAGMA secure_delete=ON")
 
         self._init_schema()
         return self._conn
@@ -83,6 +90,14 @@ class HistoryStore:
             self._migrate_to_v1()
         if version < 2:
             self._migrate_to_v2()
+        if version < 3:
+            self._migrate_to_v3()
+        if version < 4:
+            self._migrate_to_v4()
+        if version < 5:
+            self._migrate_to_v5()
+        if version < 6:
+            self._migrate_to_v6()
 
     def _get_schema_version(self) -> int:
         """Read current schema version from metadata table."""
@@ -162,20 +177,99 @@ class HistoryStore:
         )
         conn.commit()
 
+    def _migrate_to_v3(self) -> None:
+        """Migrate v2 → v3: index the encrypted flag.
+
+        encrypt_history()/decrypt_history() select clips by this flag; the
+        index lets them skip a table scan (which has to step over every
+        content BLOB) when there is nothing left to convert.
+        """
+        conn = self._conn
+        conn.executescript("""
+            CREATE INDEX IF NOT EXISTS idx_clips_encrypted
+                ON clips(encrypted);
+        """)
+
+        conn.execute(
+            "INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
+            ("schema_version", "3")
+        )
+        conn.commit()
+
+    def _migrate_to_v4(self) -> None:
+        """Migrate v3 → v4: covering index for metadata listings.
+
+        Columns stored after a large content BLOB can only be reached by
+        walking its overflow pages, so listing metadata from the table
+        reads every listed clip in full.  This index holds just the
+        metadata, letting list_recent() skip the BLOBs entirely.
+        """
+        conn = self._conn
+        conn.executescript("""
+            CREATE INDEX IF NOT EXISTS idx_clips_meta
+                ON clips(id, timestamp, content_type, size, hash, preview,
+                         source, encrypted, encrypted_meta);
+        """)
+
+        conn.execute(
+            "INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
+            ("schema_version", "4")
+        )
+        conn.commit()
+
+    def _migrate_to_v5(self) -> None:
+        """Migrate v4 → v5: drop the unused timestamp index.
+
+        Every query orders and selects by id, so this index was only
+        extra work on each save and an ISO string per row on disk.
+        """
+        conn = self._conn
+        conn.executescript("""
+            DROP INDEX IF EXISTS idx_clips_timestamp;
+        """)
+
+        conn.execute(
+            "INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
+            ("schema_version", "5")
+        )
+        conn.commit()
+
+    def _migrate_to_v6(self) -> None:
+        """Migrate v5 → v6: drop the unused hash index.
+
+        Dedup compares against the newest clip only, reading its hash
+        from idx_clips_meta, so nothing ever searches by hash.
+        """
+        conn = self._conn
+        conn.executescript("""
+            DROP INDEX IF EXISTS idx_clips_hash;
+        """)
+
+        conn.execute(
+            "INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
+            ("schema_version", "6")
+        )
+        conn.commit()
+
     def save(self, content: bytes, content_type: str = "text/plain",
-             source: str = "pipe") -> Optional[int]:
+             source: str = "pipe",
+             content_hash: Optional[str] = None) -> Optional[int]:
         """Save content to history.
 
         When encryption is configured with OS auth, content is encrypted
         transparently before storage.  Preview and hash are computed from
         the plaintext so that --list and dedup still work.
 
+        content_hash may carry the SHA-256 hex digest of content when the
+        caller already computed it (e.g. while streaming stdin).
+
         Returns the clip ID, or None if skipped (duplicate).
         """
         conn = self._ensure_conn()
 
         # Start with bare SHA-256 hash (used when not encrypting)
-        content_hash = hashlib.sha256(content).hexdigest()
+        if content_hash is None:
+            content_hash = hashlib.sha256(content).hexdigest()
         preview = _make_preview(content, self._config.history_preview_length)
         timestamp = datetime.now(timezone.utc).isoformat()
         stored_size = len(content)
@@ -184,21 +278,23 @@ class HistoryStore:
         save_content = content
         encrypted = 0
         encrypted_meta = None
-        if (self._config.security_encryption == "aes256"
-                and self._config.security_auth_method != "password"):
+        if auto_encrypts(self._config):
             try:
                 from .encryption import (
                     is_available, get_encryption_key,
-                    encrypt as aes_encrypt,
+                    _new_cipher, _encrypt_with,
                 )
                 if is_available():
                     key = get_encryption_key(self._config, self)
-                    save_content = aes_encrypt(content, key)
+                    # One cipher for content and metadata; the bytearray
+                    # blob goes straight to SQLite without a bytes copy
+                    aesgcm = _new_cipher(key)
+                    save_content = _encrypt_with(aesgcm, content)
                     encrypted = 1
                     # Encrypt metadata into a separate blob
                     import json
                     meta = json.dumps({"content_type": content_type}).encode()
-                    encrypted_meta = aes_encrypt(meta, key)
+                    encrypted_meta = _encrypt_with(aesgcm, meta)
                     preview = "(encrypted)"
                     content_type = "(encrypted)"
                     # HMAC hash with encryption key — prevents offline
@@ -214,21 +310,25 @@ class HistoryStore:
             except Exception as e:
                 _warn(f"auto-encrypt failed, saving plaintext: {e}")
 
-        # Dedup: skip if hash matches most recent entry
-        last = conn.execute(
-            "SELECT hash FROM clips ORDER BY id DESC LIMIT 1"
-        ).fetchone()
-        if last and last["hash"] == content_hash:
-            return None
-
+        # Dedup in the same statement: insert only if the most recent
+        # entry has a different hash.  The planner reads that hash from
+        # idx_clips_meta, so a large previous clip's BLOB is not walked;
+        # IS NOT also lets the first save into an empty table through.
         cursor = conn.execute(
             """INSERT INTO clips
                (timestamp, content_type, content, size, hash, preview,
                 source, encrypted, encrypted_meta)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+               SELECT ?, ?, ?, ?, ?, ?, ?, ?, ?
+               WHERE ? IS NOT (
+                   SELECT hash FROM clips ORDER BY id DESC LIMIT 1
+               )""",
             (timestamp, content_type, save_content, stored_size,
-             content_hash, preview, source, encrypted, encrypted_meta)
+             content_hash, preview, source, encrypted, encrypted_meta,
+             content_hash)
         )
+        if cursor.rowcount == 0:
+            conn.rollback()  # duplicate; end the implicit transaction
+            return None
         clip_id = cursor.lastrowid
 
         # FIFO eviction
@@ -264,6 +364,26 @@ class HistoryStore:
 
         return bytes(row["content"]) if row else None
 
+    def get_clips_bulk(self, ids: list) -> dict:
+        """Retrieve content for several clips by database ID in one pass.
+
+        Returns a dict mapping clip ID to raw content bytes; IDs that
+        don't exist are simply absent from the result.
+        """
+        conn = self._ensure_conn()
+        result = {}
+        # Stay well under SQLite's host-parameter limit (999 on old builds)
+        for start in range(0, len(ids), _MAX_SQL_PARAMS):
+            batch = ids[start:start + _MAX_SQL_PARAMS]
+            placeholders = ",".join("?" * len(batch))
+            rows = conn.execute(
+                f"SELECT id, content FROM clips WHERE id IN ({placeholders})",
+                batch,
+            )
+            for row in rows:
+                result[row["id"]] = bytes(row["content"])
+        return result
+
     def get_clip_entry(self, index: int) -> Optional[Tuple[HistoryEntry, bytes]]:
         """Retrieve full clip entry (metadata + content) by 1-based index.
 
@@ -295,10 +415,7 @@ class HistoryStore:
         conn.execute("DELETE FROM clips")
         conn.commit()
         if count > 0:
-            try:
-                conn.execute("VACUUM")
-            except sqlite3.OperationalError:
-                pass  # best-effort; scrubs residual data from free pages
+            self._compact()
         return count
 
     def delete_by_indices(self, indices: list) -> int:
@@ -309,40 +426,67 @@ class HistoryStore:
 
         Returns the number of clips actually deleted.
         """
-        if not indices:
-            return 0
-
-        conn = self._ensure_conn()
+        return self.delete_by_ranges(list(_ranges(sorted(set(indices)))))
 
-        # Get all clip IDs in display order (newest first)
-        rows = conn.execute(
-            "SELECT id FROM clips ORDER BY id DESC"
-        ).fetchall()
+    def delete_by_ranges(self, ranges: list) -> int:
+        """Delete clips by inclusive (start, end) display-index ranges.
 
-        total = len(rows)
-        # Map 1-based indices to database IDs
-        ids_to_delete = []
-        for idx in indices:
-            if 1 <= idx <= total:
-                ids_to_delete.append(rows[idx - 1]["id"])
+        ranges must be sorted and disjoint, as parse_clear_ranges() and
+        _ranges() produce.  Each range is deleted with one id-range DELETE.
 
-        if not ids_to_delete:
+        Returns the number of clips actually deleted.
+        """
+        if not ranges:
             return 0
 
-        placeholders = ",".join("?" * len(ids_to_delete))
-        conn.execute(
-            f"DELETE FROM clips WHERE id IN ({placeholders})",
-            ids_to_delete,
-        )
+        conn = self._ensure_conn()
+        id_at = "SELECT id FROM clips ORDER BY id DESC LIMIT 1 OFFSET ?"
+
+        # Oldest runs first, so deleting them never shifts the display
+        # positions of the newer runs still to come.
+        deleted = 0
+        for start, end in reversed(ranges):
+            start = max(start, 1)
+            if start > end:
+                continue
+            newest = conn.execute(id_at, (start - 1,)).fetchone()
+            if newest is None:
+                continue  # whole run is past the end of history
+            oldest = conn.execute(id_at, (end - 1,)).fetchone()
+            if oldest is None:
+                cur = conn.execute(
+                    "DELETE FROM clips WHERE id <= ?", (newest["id"],)
+                )
+            else:
+                cur = conn.execute(
+                    "DELETE FROM clips WHERE id BETWEEN ? AND ?",
+                    (oldest["id"], newest["id"]),
+                )
+            deleted += cur.rowcount
         conn.commit()
 
-        if ids_to_delete:
-            try:
-                conn.execute("VACUUM")
-            except sqlite3.OperationalError:
-                pass  # best-effort
+        if deleted:
+            self._compact()
+
+        return deleted
 
-        return len(ids_to_delete)
+    def _compact(self) -> None:
+        """Tidy up the file after bulk deletes or rewrites.
+
+        secure_delete has already zeroed the freed content, so the full
+        VACUUM (a rewrite of the whole file) only runs once free pages
+        exceed a quarter of the database.  The WAL is then truncated so
+        it holds no stale page images.
+        """
+        conn = self._ensure_conn()
+        try:
+            free = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            total = conn.execute("PRAGMA page_count").fetchone()[0]
+            if free * 4 > total:
+                conn.execute("VACUUM")
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        except sqlite3.OperationalError:
+            pass  # best-effort; concurrent access may block either step
 
     def count(self) -> int:
         """Return the total number of clips in history."""
@@ -354,9 +498,11 @@ class HistoryStore:
         """Delete oldest entries exceeding max_entries."""
         if max_entries <= 0:
             return
+        # Everything at or below the newest entry past the limit; a rowid
+        # range delete instead of a NOT IN scan of the whole table
         self._conn.execute(
-            """DELETE FROM clips WHERE id NOT IN (
-                   SELECT id FROM clips ORDER BY id DESC LIMIT ?
+            """DELETE FROM clips WHERE id <= (
+                   SELECT id FROM clips ORDER BY id DESC LIMIT 1 OFFSET ?
                )""",
             (max_entries,)
         )
@@ -364,6 +510,12 @@ class HistoryStore:
     def close(self) -> None:
         """Close the database connection."""
         if self._conn is not None:
+            try:
+                # Cheap for short-lived connections; refreshes planner stats
+                # only when SQLite judges them stale
+                self._conn.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass
             self._conn.close()
             self._conn = None
 
@@ -374,6 +526,12 @@ class HistoryStore:
         self.close()
 
 
+def auto_encrypts(config: Config) -> bool:
+    """Whether save() encrypts new clips (and so keys their hash by HMAC)."""
+    return (config.security_encryption == "aes256"
+            and config.security_auth_method != "password")
+
+
 def _make_preview(data: bytes, max_len: int = 80) -> str:
     """Generate a short preview string for display in --list."""
     if not data:
@@ -385,13 +543,36 @@ def _make_preview(data: bytes, max_len: int = 80) -> str:
         hex_preview = data[:20].hex()
         return f"(binary, {len(data)} bytes) {hex_preview}"
 
-    # Collapse whitespace to single line
-    preview = " ".join(text.split())
+    # Collapse whitespace to single line.  Only a prefix is collapsed:
+    # the collapsed prefix is always a prefix of the collapsed whole, so
+    # once it is longer than max_len the rest of the text cannot matter.
+    limit = max(4 * max_len, 256)
+    while True:
+        preview = " ".join(text[:limit].split())
+        if len(preview) > max_len or limit >= len(text):
+            break
+        limit *= 4
     if len(preview) > max_len:
         preview = preview[:max_len - 3] + "..."
     return preview
 
 
+def _ranges(indices):
+    """Group sorted, unique ints into inclusive (start, end) runs.
+
+    [1, 2, 3, 7, 9, 10] -> (1, 3), (7, 7), (9, 10)
+    """
+    it = iter(indices)
+    for start in it:
+        prev = start
+        for x in it:
+            if x != prev + 1:
+                yield start, prev
+                start = x
+            prev = x
+        yield start, prev
+
+
 def _mask_size(real_size: int, key: bytes, content_hash: str) -> int:
     """XOR-mask a size value using a per-clip key-derived mask.
 
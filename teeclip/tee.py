@@ -10,6 +10,9 @@ import sys
 
 from .clipboard import copy_to_clipboard, ClipboardError
 
+# Upper bound per read; read1() returns whatever is already available
+_READ_SIZE = 64 * 1024
+
 
 def tee_to_clipboard(
     files=None,
@@ -45,11 +48,26 @@ def tee_to_clipboard(
     # Read stdin in binary mode, pass through to stdout, buffer for clipboard
     stdin = sys.stdin.buffer
     stdout = sys.stdout.buffer
-    chunks = []
+    read = getattr(stdin, "read1", stdin.read)
+    # One growing buffer: no per-chunk list and no join copy at EOF
+    data = bytearray()
+
+    # Hash while the chunks are still hot instead of re-reading the whole
+    # buffer at EOF (encrypted saves use an HMAC instead, computed later)
+    hasher = None
+    if save_history:
+        try:
+            from .config import Config
+            from .history import auto_encrypts
+            if not auto_encrypts(config or Config()):
+                import hashlib
+                hasher = hashlib.sha256()
+        except Exception:
+            pass  # save() hashes the buffer itself (and reports errors)
 
     try:
         while True:
-            chunk = stdin.read(8192)
+            chunk = read(_READ_SIZE)
             if not chunk:
                 break
 
@@ -62,7 +80,9 @@ def tee_to_clipboard(
                 fh.write(chunk)
 
             # Buffer for clipboard and/or history
-            chunks.append(chunk)
+            data += chunk
+            if hasher is not None:
+                hasher.update(chunk)
 
     except KeyboardInterrupt:
         # Ctrl+C — still try to copy what we have so far
@@ -79,11 +99,9 @@ def tee_to_clipboard(
             except OSError:
                 pass
 
-    if not chunks:
+    if not data:
         return
 
-    data = b"".join(chunks)
-
     # Copy buffered content to clipboard
     if not no_clipboard:
         try:
@@ -96,9 +114,9 @@ def tee_to_clipboard(
     if save_history and data:
         try:
             from .history import HistoryStore
-            store = HistoryStore(config=config)
-            store.save(data, source="pipe")
-            store.close()
+            with HistoryStore(config=config) as store:
+                store.save(data, source="pipe", content_hash=(
+                    hasher.hexdigest() if hasher is not None else None))
         except Exception as e:
             if not quiet:
                 print(f"teeclip: history: {e}", file=sys.stderr)
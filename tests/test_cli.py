@@ -1,5 +1,6 @@
 """Tests for teeclip CLI."""
 
+import os
 import subprocess
 import sys
 
@@ -81,3 +82,85 @@ def test_empty_input():
     )
     assert result.returncode == 0
     assert result.stdout == ""
+
+
+def test_short_version_flag():
+    """teeclip -V takes the fast path and prints the version."""
+    result = subprocess.run(
+        [sys.executable, "-m", "teeclip", "-V"],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0
+    assert result.stdout.startswith("teeclip ")
+
+
+def test_build_parser_is_cached():
+    """build_parser() returns the same parser object on repeated calls."""
+    from teeclip.cli import build_parser
+
+    assert build_parser() is build_parser()
+    first = build_parser().parse_args(["--list", "5"])
+    second = build_parser().parse_args([])
+    assert first.list_history == 5
+    assert second.list_history is None
+
+
+def test_write_stdout_direct_to_pipe():
+    """_write_stdout writes large blobs intact, after earlier buffered output."""
+    code = (
+        "import sys\n"
+        "from teeclip.cli import _write_stdout\n"
+        "sys.stdout.write('head\\n')\n"
+        "_write_stdout(b'x' * 300000 + b'\\n')\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True,
+    )
+    assert result.returncode == 0
+    assert result.stdout == b"head\n" + b"x" * 300000 + b"\n"
+
+
+def test_help_fast_path_matches_argparse(capsys):
+    """main(['--help']) prints exactly what argparse would."""
+    from teeclip.cli import main, build_parser
+
+    main(["-h"])
+    assert capsys.readouterr().out == build_parser().format_help()
+
+
+def test_paste_imports_only_clipboard():
+    """--paste loads the clipboard module but not config/history/tee."""
+    code = (
+        "import sys\n"
+        "from teeclip import cli\n"
+        "try:\n"
+        "    cli.main(['--paste', '--backend', 'no-such-backend'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "mods = ['teeclip.config', 'teeclip.history', 'teeclip.encryption',\n"
+        "        'teeclip.tee']\n"
+        "print([m for m in mods if m in sys.modules])\n"
+        "print('teeclip.clipboard' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True,
+    )
+    assert result.stdout.splitlines() == ["[]", "True"]
+
+
+def test_plain_tee_skips_argparse(tmp_path):
+    """Flag-free and simple-flag invocations never import argparse."""
+    code = (
+        "import sys\n"
+        "from teeclip import cli\n"
+        "cli.main(['-nc', '--no-history', '-q'])\n"
+        "sys.stderr.write(str('argparse' in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], input="hi\n",
+        capture_output=True, text=True,
+        env={**os.environ, "TEECLIP_HOME": str(tmp_path)},
+    )
+    assert result.stdout == "hi\n"
+    assert result.stderr == "False"
@@ -38,6 +38,28 @@ def test_config_shows_settings(run_teeclip):
 # ── --list ────────────────────────────────────────────────────────────
 
 
+def test_list_decrypts_os_auth_previews(teeclip_home, config_file, capsys):
+    """--list shows decrypted previews for OS-auth encrypted entries."""
+    pytest.importorskip("cryptography")
+    from teeclip.cli import main
+    from teeclip.config import load_config
+    from teeclip.encryption import get_key_provider
+    from teeclip.history import HistoryStore
+
+    config_file('[security]\nencryption = "aes256"\nauth_method = "os"\n')
+    config = load_config()
+    with HistoryStore(config=config) as store:
+        store.save(b"first secret", source="test")
+        store.save(b"second secret", source="test")
+    try:
+        main(["--list"])
+        out = capsys.readouterr().out
+        assert "[E]  second secret" in out
+        assert "[E]  first secret" in out
+    finally:
+        get_key_provider(config).delete_key()
+
+
 def test_list_empty_history(run_teeclip):
     """--list on empty history shows placeholder."""
     result = run_teeclip(["--list"])
@@ -435,9 +457,35 @@ def test_paste_does_not_save_history(teeclip_home, mock_clipboard, capsys):
         assert store.count() == 0
 
 
+def test_paste_skips_config_load(teeclip_home, mock_clipboard, config_file, capsys):
+    """--paste never reads config.toml (a broken file produces no warning)."""
+    from teeclip.cli import main
+
+    config_file("[history\nthis is not toml = = =\n")
+    mock_clipboard["content"] = b"paste-no-config"
+    main(["--paste"])
+
+    captured = capsys.readouterr()
+    assert "paste-no-config" in captured.out
+    assert "config" not in captured.err
+
+
 # ── --get interactions ───────────────────────────────────────────────
 
 
+def test_get_copies_to_clipboard(teeclip_home, mock_clipboard, capsys):
+    """--get N writes to stdout and also copies the clip to the clipboard."""
+    from teeclip.cli import main
+    from teeclip.history import HistoryStore
+
+    with HistoryStore() as store:
+        store.save(b"get-clipboard-test", source="test")
+
+    main(["--get", "1"])
+    assert "get-clipboard-test" in capsys.readouterr().out
+    assert mock_clipboard["content"] == b"get-clipboard-test"
+
+
 def test_get_outputs_to_stdout(run_teeclip):
     """--get N writes clip content to stdout."""
     run_teeclip(["--no-clipboard"], input_data="get-stdout-test")
@@ -2,6 +2,8 @@
 
 import platform
 
+import pytest
+
 from teeclip.clipboard import detect_backend, _is_wsl, ClipboardError
 
 
@@ -30,3 +32,77 @@ def test_wsl_detection_type():
     """_is_wsl should return a boolean."""
     result = _is_wsl()
     assert isinstance(result, bool)
+
+
+def test_detect_backend_is_cached():
+    """Repeated detection reuses the first result until the cache is cleared."""
+    try:
+        first = detect_backend()
+    except ClipboardError:
+        return
+    assert detect_backend() is first
+    detect_backend.cache_clear()
+    assert detect_backend() is not first
+
+
+def test_get_backend_unknown_name():
+    """Unknown backend names list every registered backend."""
+    from teeclip.clipboard import get_backend
+    with pytest.raises(ClipboardError, match="Unknown backend 'no-such-backend'") as exc:
+        get_backend("no-such-backend")
+    assert "xclip" in str(exc.value) and "wsl" in str(exc.value)
+
+
+@pytest.mark.parametrize("data", [
+    b"small",
+    b"x" * 300000,
+    [b"a" * 100000, memoryview(b"b" * 100000)],
+    [b"tiny", b"chunks"],
+], ids=["small", "large", "large-chunks", "small-chunks"])
+def test_run_clip_feeds_stdin(data):
+    """_run_clip delivers bytes and chunk lists intact to the tool's stdin."""
+    import hashlib
+    import sys
+    from teeclip.clipboard import _run_clip
+
+    expected = data if isinstance(data, bytes) else b"".join(data)
+    code = (
+        "import hashlib, sys; "
+        "sys.stderr.write(hashlib.sha256(sys.stdin.buffer.read()).hexdigest())"
+    )
+    returncode, stdout, stderr = _run_clip([sys.executable, "-c", code], data)
+    assert returncode == 0
+    assert stdout == b""
+    assert stderr.decode() == hashlib.sha256(expected).hexdigest()
+
+
+def test_run_clip_captures_stdout():
+    """Reader tools have their full stdout returned as bytes."""
+    import sys
+    from teeclip.clipboard import _run_clip
+
+    code = "import sys; sys.stdout.buffer.write(bytes(range(256)) * 1000)"
+    returncode, stdout, stderr = _run_clip([sys.executable, "-c", code])
+    assert returncode == 0
+    assert type(stdout) is bytes
+    assert stdout == bytes(range(256)) * 1000
+
+
+def test_exec_maps_failures_to_clipboard_error():
+    """_exec reports missing tools and non-zero exits as ClipboardError."""
+    import sys
+    from teeclip.clipboard import _exec
+
+    with pytest.raises(ClipboardError, match="^nope not found$"):
+        _exec(["teeclip-no-such-tool"], label="nope failed", missing="nope not found")
+    code = "import sys; sys.stderr.write('boom'); sys.exit(3)"
+    with pytest.raises(ClipboardError, match="^tool failed: boom$"):
+        _exec([sys.executable, "-c", code], label="tool failed", missing="x")
+
+
+@pytest.mark.skipif(platform.system() != "Windows", reason="Win32 API only on Windows")
+def test_win32_paste_returns_bytes():
+    """The in-process Win32 reader returns bytes, or None to fall back."""
+    from teeclip.clipboard import _win32_paste
+    result = _win32_paste()
+    assert result is None or isinstance(result, bytes)
@@ -2,7 +2,9 @@
 
 import sys
 
-from teeclip.config import Config, load_config, format_config
+import pytest
+
+from teeclip.config import Config, load_config, format_config, _scan_simple_toml
 
 
 def test_default_config_when_no_file(teeclip_home):
@@ -136,3 +138,55 @@ def test_integer_coercion(config_file):
     config = load_config()
     assert config.history_max_entries == 200
     assert isinstance(config.history_max_entries, int)
+
+
+def test_scan_simple_toml_reads_plain_config():
+    """Plain sections of strings, bools, and ints parse without tomllib."""
+    text = (
+        "# teeclip\n"
+        "[history]\n"
+        "enabled = true  # on\n"
+        "max_entries = 1_000\n"
+        "[clipboard]\n"
+        "backend = \"xclip\"\n"
+        "[output]\n"
+        "quiet = false\n"
+        "[security]\n"
+        "auth_method = 'password'\n"
+    )
+    assert _scan_simple_toml(text) == {
+        "history": {"enabled": True, "max_entries": 1000},
+        "clipboard": {"backend": "xclip"},
+        "output": {"quiet": False},
+        "security": {"auth_method": "password"},
+    }
+
+
+@pytest.mark.parametrize("text", [
+    "top = 1\n",
+    "[a.b]\nx = 1\n",
+    "[[a]]\nx = 1\n",
+    "[a]\nx = 1\nx = 2\n",
+    "[a]\n[a]\n",
+    "[a]\nx = 1.5\n",
+    "[a]\nx = 01\n",
+    "[a]\nx = True\n",
+    "[a]\nx = [1, 2]\n",
+    "[a]\nx = \"tab\\\\t\"\n",
+    "[a]\nx = \"\"\"\nmulti\n\"\"\"\n",
+    "[a]\n\"quoted\" = 1\n",
+    "[a]\nx = \"v\" trailing\n",
+])
+def test_scan_simple_toml_defers(text):
+    """Anything outside the plain subset is left to the full parser."""
+    assert _scan_simple_toml(text) is None
+
+
+def test_defaults_table_covers_every_field():
+    """_DEFAULTS maps onto Config one-to-one, with matching defaults."""
+    import dataclasses
+    from teeclip.config import _FIELDS
+
+    assert {f[0]: f[3] for f in _FIELDS} == {
+        f.name: f.default for f in dataclasses.fields(Config)
+    }
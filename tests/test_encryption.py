@@ -28,10 +28,15 @@ from teeclip.encryption import (
     decrypt_history,
     decrypt_single,
     get_or_create_salt,
+    derive_store_key,
+    get_store_kdf,
+    KDF_PBKDF2,
+    KDF_SCRYPT,
     get_key_provider,
     get_encryption_key,
     DPAPIKeyProvider,
     FileKeyProvider,
+    SecretToolKeyProvider,
     PasswordKeyProvider,
     KeyProvider,
     EncryptionError,
@@ -82,6 +87,73 @@ def test_derive_key_different_passwords():
     assert key1 != key2
 
 
+def test_derive_key_is_memoized(monkeypatch):
+    """Repeat derivations reuse the cached key instead of rerunning PBKDF2."""
+    from teeclip import encryption
+
+    encryption.clear_key_cache()
+    salt = generate_salt()
+    calls = []
+    real = encryption._pbkdf2_sha256
+    monkeypatch.setattr(
+        encryption, "_pbkdf2_sha256", lambda *a: calls.append(1) or real(*a)
+    )
+    key1 = derive_key("password", salt)
+    key2 = derive_key("password", salt)
+    assert key1 == key2
+    assert len(calls) == 1
+    assert all(b"password" not in k[0] for k in encryption._DERIVED_KEYS)
+    encryption.clear_key_cache()
+    assert derive_key("password", salt) == key1
+    assert len(calls) == 2
+
+
+def test_pbkdf2_matches_hashlib():
+    """The cryptography-backed PBKDF2 yields the same key as hashlib."""
+    import hashlib
+    from teeclip.encryption import _pbkdf2_sha256, PBKDF2_ITERATIONS, KEY_SIZE
+    salt = generate_salt()
+    expected = hashlib.pbkdf2_hmac(
+        "sha256", b"password", salt, PBKDF2_ITERATIONS, KEY_SIZE
+    )
+    assert _pbkdf2_sha256(b"password", salt) == expected
+
+
+def test_new_store_uses_scrypt(history_store):
+    """A fresh store records scrypt and derives keys with it."""
+    salt = get_or_create_salt(history_store)
+    assert get_store_kdf(history_store) == KDF_SCRYPT
+    assert derive_store_key("pw", history_store) == derive_key("pw", salt, KDF_SCRYPT)
+    assert derive_key("pw", salt, KDF_SCRYPT) != derive_key("pw", salt)
+
+
+def test_legacy_store_keeps_pbkdf2(history_store):
+    """A store with a salt but no KDF record still derives with PBKDF2."""
+    conn = history_store._ensure_conn()
+    salt = generate_salt()
+    conn.execute(
+        "INSERT INTO metadata (key, value) VALUES ('encryption_salt', ?)",
+        (salt.hex(),),
+    )
+    conn.commit()
+    assert get_store_kdf(history_store) == KDF_PBKDF2
+    assert derive_store_key("pw", history_store) == derive_key("pw", salt)
+
+
+def test_derive_key_unknown_kdf():
+    """An unrecognized KDF name raises EncryptionError."""
+    with pytest.raises(EncryptionError, match="Unknown key derivation"):
+        derive_key("pw", generate_salt(), "rot13")
+
+
+def test_derive_key_scrypt_unavailable(monkeypatch):
+    """A scrypt store on a Python without hashlib.scrypt fails cleanly."""
+    import hashlib
+    monkeypatch.delattr(hashlib, "scrypt", raising=False)
+    with pytest.raises(EncryptionError, match="needs scrypt support"):
+        derive_key("pw", generate_salt(), KDF_SCRYPT)
+
+
 def test_derive_key_different_salts():
     """Different salts produce different keys."""
     key1 = derive_key("password", generate_salt())
@@ -114,6 +186,7 @@ def test_encrypt_decrypt_roundtrip():
     plaintext = b"Hello, encrypted world!"
 
     blob = encrypt(plaintext, key)
+    assert type(blob) is bytes
     result = decrypt(blob, key)
     assert result == plaintext
 
@@ -179,6 +252,16 @@ def test_decrypt_too_short():
         decrypt(b"short", key)
 
 
+def test_reused_cipher_matches_one_shot():
+    """A cipher reused across clips interoperates with encrypt/decrypt."""
+    from teeclip.encryption import _new_cipher, _encrypt_with, _decrypt_with
+    key = derive_key("secret", generate_salt())
+    cipher = _new_cipher(key)
+    blobs = [_encrypt_with(cipher, b"clip %d" % i) for i in range(3)]
+    assert [decrypt(b, key) for b in blobs] == [b"clip 0", b"clip 1", b"clip 2"]
+    assert _decrypt_with(cipher, encrypt(b"one-shot", key)) == b"one-shot"
+
+
 def test_each_encryption_unique():
     """Encrypting the same data twice produces different blobs (random nonce)."""
     key = derive_key("secret", generate_salt())
@@ -204,6 +287,21 @@ def test_get_or_create_salt_stable(history_store):
     assert salt1 == salt2
 
 
+# ── Password prompt ─────────────────────────────────────────────────
+
+
+def test_prompt_password_confirm(monkeypatch):
+    """Confirmation must match the first entry exactly."""
+    import getpass
+    from teeclip.encryption import prompt_password
+
+    answers = iter(["pässword", "pässword", "pässword", "password"])
+    monkeypatch.setattr(getpass, "getpass", lambda prompt: next(answers))
+    assert prompt_password(confirm=True) == "pässword"
+    with pytest.raises(EncryptionError, match="do not match"):
+        prompt_password(confirm=True)
+
+
 # ── Batch encrypt/decrypt history ────────────────────────────────────
 
 
@@ -224,6 +322,35 @@ def test_encrypt_history_idempotent(populated_history):
     assert count == 0
 
 
+def test_history_conversion_in_batches(populated_history, monkeypatch):
+    """Clips are converted a batch at a time and all of them round-trip."""
+    from teeclip import encryption
+
+    monkeypatch.setattr(encryption, "_HISTORY_BATCH_ROWS", 2)
+    assert encrypt_history(populated_history, "test-password") == 5
+    assert all(e.encrypted for e in populated_history.list_recent())
+    assert decrypt_history(populated_history, "test-password") == 5
+    # get_clip(1) is the newest clip
+    assert [populated_history.get_clip(i) for i in range(1, 6)] == [
+        f"clip {i}".encode() for i in range(5, 0, -1)
+    ]
+
+
+def test_failed_decrypt_history_rolls_back(populated_history, monkeypatch):
+    """A decrypt failure part-way through leaves every clip encrypted."""
+    from teeclip import encryption
+
+    monkeypatch.setattr(encryption, "_HISTORY_BATCH_ROWS", 2)
+    encrypt_history(populated_history, "test-password")
+    conn = populated_history._ensure_conn()
+    conn.execute("UPDATE clips SET content = ? WHERE id = 5", (b"x" * 40,))
+    conn.commit()
+
+    with pytest.raises(EncryptionError):
+        decrypt_history(populated_history, "test-password")
+    assert all(e.encrypted for e in populated_history.list_recent())
+
+
 def test_decrypt_history(populated_history):
     """decrypt_history restores all encrypted clips and metadata."""
     import hashlib
@@ -270,8 +397,7 @@ def test_encrypt_hardens_metadata(populated_history):
     real_sizes = {e.hash: e.size for e in entries_before}
 
     # Get the encryption key for unmask verification
-    salt = get_or_create_salt(populated_history)
-    key = derive_key("test-password", salt)
+    key = derive_store_key("test-password", populated_history)
 
     encrypt_history(populated_history, "test-password")
     entries = populated_history.list_recent()
@@ -320,8 +446,7 @@ def test_field_roundtrip_plaintext_encrypt_decrypt(populated_history):
         assert entry.preview != "(encrypted)"
 
     # ── Phase 2: Encrypted ──
-    salt = get_or_create_salt(populated_history)
-    key = derive_key("test-password", salt)
+    key = derive_store_key("test-password", populated_history)
 
     encrypt_history(populated_history, "test-password")
     entries_enc = populated_history.list_recent()
@@ -515,6 +640,35 @@ def test_get_encryption_key_os_mode(teeclip_home):
     provider.delete_key()
 
 
+def test_get_encryption_key_os_mode_single_lookup(history_store, monkeypatch):
+    """An existing secret-tool key is read with one tool invocation."""
+    import subprocess
+    from teeclip import encryption
+
+    key = b"\x07" * KEY_SIZE
+    calls = []
+
+    def fake_run(argv, **kwargs):
+        calls.append(argv)
+        return subprocess.CompletedProcess(argv, 0, key.hex().encode(), b"")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    monkeypatch.setattr(encryption, "get_key_provider",
+                        lambda config: SecretToolKeyProvider())
+    config = Config(security_encryption="aes256", security_auth_method="os")
+
+    assert get_encryption_key(config, history_store) == key
+    assert len(calls) == 1 and calls[0][:2] == ["secret-tool", "lookup"]
+
+
+def test_lookup_key_missing_returns_none(tmp_path):
+    """lookup_key reports a missing key as None rather than raising."""
+    provider = FileKeyProvider(tmp_path / "nonexistent")
+    assert provider.lookup_key() is None
+    provider.store_key(b"\x01" * KEY_SIZE)
+    assert provider.lookup_key() == b"\x01" * KEY_SIZE
+
+
 def test_get_encryption_key_password_mode(history_store):
     """Password mode derives key from provided password."""
     config = Config(security_auth_method="password")
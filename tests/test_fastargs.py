@@ -0,0 +1,62 @@
+"""Tests for the hand-rolled argv parser."""
+
+import pytest
+
+from teeclip._fastargs import defaults, parse
+from teeclip.cli import build_parser
+
+
+def test_defaults_match_parser():
+    """defaults() matches what argparse produces for an empty argv."""
+    assert vars(defaults()) == vars(build_parser().parse_args([]))
+
+
+@pytest.mark.parametrize("argv", [
+    [],
+    ["out.txt"],
+    ["-a", "log.txt"],
+    ["--append", "a.txt", "b.txt", "-q"],
+    ["-nc", "--no-history"],
+    ["--no-clipboard", "--quiet", "file"],
+    ["-p"],
+    ["--paste", "--backend", "xclip"],
+    ["--backend=wsl"],
+    ["--list"],
+    ["-l", "20"],
+    ["-l5"],
+    ["--list=all", "-q"],
+    ["--list", "-q"],
+    ["--get", "1"],
+    ["-g3"],
+    ["--get=2"],
+    ["--clear"],
+    ["--clear", "2,4:10"],
+    ["--clear=3"],
+    ["--clear", "--no-history"],
+    ["-s", "--config", "--encrypt", "--decrypt"],
+    ["--list", "5", "a.txt"],
+    ["a.txt", "--get", "1"],
+])
+def test_parse_matches_argparse(argv):
+    """parse() agrees with argparse for every argv shape it accepts."""
+    assert vars(parse(argv)) == vars(build_parser().parse_args(argv))
+
+
+@pytest.mark.parametrize("argv", [
+    ["-aq"],
+    ["--", "-x"],
+    ["--app"],
+    ["-"],
+    ["--help"],
+    ["a.txt", "-q", "b.txt"],
+    ["--list", "x"],
+    ["--list", "0"],
+    ["--get", "x"],
+    ["--get", "-1"],
+    ["--get"],
+    ["--backend", "-q"],
+    ["--paste=1"],
+])
+def test_parse_defers_to_argparse(argv):
+    """Anything argparse might read differently, or reject, returns None."""
+    assert parse(argv) is None
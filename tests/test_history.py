@@ -132,6 +132,16 @@ def test_dedup_allows_nonconsecutive_identical(history_store):
     assert history_store.count() == 3
 
 
+def test_save_uses_precomputed_hash(history_store):
+    """A caller-supplied SHA-256 digest is stored and used for dedup."""
+    import hashlib
+
+    digest = hashlib.sha256(b"streamed").hexdigest()
+    assert history_store.save(b"streamed", content_hash=digest) is not None
+    assert history_store.list_recent()[0].hash == digest
+    assert history_store.save(b"streamed") is None
+
+
 def test_dedup_different_content_saved(history_store):
     """Different content is always saved."""
     history_store.save(b"one")
@@ -272,6 +282,19 @@ def test_preview_truncated():
     assert preview.endswith("...")
 
 
+def test_preview_large_and_whitespace_heavy():
+    """Only a prefix is collapsed, with the same result as the whole text."""
+    words = ("word " * 100_000).encode()
+    assert _make_preview(words, max_len=20) == "word word word wo..."
+
+    # Leading whitespace longer than the first prefix window
+    padded = b" \n" * 5_000 + b"tail text"
+    assert _make_preview(padded) == "tail text"
+
+    # Invalid UTF-8 past the prefix still marks the clip as binary
+    assert "(binary," in _make_preview(b"a" * 10_000 + b"\xff")
+
+
 def test_preview_binary():
     """Binary data shows hex preview."""
     data = bytes([0xFF, 0xFE, 0x00, 0x01])
@@ -297,6 +320,23 @@ def test_preview_exact_max_len():
 # ── Schema versioning ────────────────────────────────────────────────
 
 
+def test_deleted_clips_are_scrubbed_from_disk(history_store):
+    """Deleted content is zeroed in the database files, not just unlinked."""
+    marker = b"scrub-me-0123456789"
+    history_store.save(b"keep one")
+    history_store.save(marker)
+    history_store.save(b"keep two")
+    assert history_store.delete_by_indices([2]) == 1
+
+    db_path = history_store._db_path
+    wal_path = db_path.with_name(db_path.name + "-wal")
+    on_disk = db_path.read_bytes()
+    if wal_path.exists():
+        on_disk += wal_path.read_bytes()
+    assert marker not in on_disk
+    assert b"keep two" in on_disk
+
+
 def test_schema_version_stored(history_store):
     """Schema version is recorded in metadata table."""
     history_store.count()  # ensure schema is initialized
@@ -305,7 +345,65 @@ def test_schema_version_stored(history_store):
         "SELECT value FROM metadata WHERE key = 'schema_version'"
     ).fetchone()
     assert row is not None
-    assert row["value"] == "2"
+    assert row["value"] == "6"
+
+
+def test_unused_indexes_dropped(history_store):
+    """The unused timestamp and hash indexes are gone after migration."""
+    history_store.count()
+    conn = history_store._ensure_conn()
+    names = {row["name"] for row in conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert "idx_clips_timestamp" not in names
+    assert "idx_clips_hash" not in names
+    assert "idx_clips_meta" in names
+
+
+def test_list_recent_reads_covering_index(history_store):
+    """Listing metadata never touches the content BLOBs."""
+    history_store.save(b"x" * 100_000)
+    conn = history_store._ensure_conn()
+    plan = conn.execute(
+        """EXPLAIN QUERY PLAN
+           SELECT id, timestamp, content_type, size, hash,
+                  preview, source, encrypted, encrypted_meta
+           FROM clips ORDER BY id DESC LIMIT ?""", (10,)
+    ).fetchall()
+    assert any("COVERING INDEX idx_clips_meta" in row["detail"]
+               for row in plan)
+
+
+def test_save_dedup_reads_covering_index(history_store):
+    """The dedup check reads the previous hash without the BLOB."""
+    history_store.save(b"x" * 100_000)
+    conn = history_store._ensure_conn()
+    plan = conn.execute(
+        "EXPLAIN QUERY PLAN SELECT hash FROM clips ORDER BY id DESC LIMIT 1"
+    ).fetchall()
+    assert any("COVERING INDEX idx_clips_meta" in row["detail"]
+               for row in plan)
+
+
+def test_save_without_metadata_index(history_store):
+    """Saving and dedup still work if idx_clips_meta is missing."""
+    conn = history_store._ensure_conn()
+    conn.execute("DROP INDEX idx_clips_meta")
+    assert history_store.save(b"one") is not None
+    assert history_store.save(b"one") is None
+    assert history_store.save(b"two") is not None
+    assert history_store.count() == 2
+
+
+def test_encrypted_flag_queries_use_index(history_store):
+    """Selecting clips by encryption state does not scan the table."""
+    history_store.save(b"plain")
+    conn = history_store._ensure_conn()
+    for flag in (0, 1):
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id, content FROM clips "
+            "WHERE encrypted = ?", (flag,)
+        ).fetchall()
+        assert any("idx_clips_encrypted" in row["detail"] for row in plan)
 
 
 def test_created_at_stored(history_store):
@@ -401,6 +499,27 @@ def test_delete_by_indices_out_of_range(history_store):
     assert history_store.count() == 1
 
 
+def test_delete_by_ranges(history_store):
+    """Index ranges delete the right clips even with gaps in the ids."""
+    for i in range(1, 9):
+        history_store.save(f"clip {i}".encode(), source="test")
+    history_store.delete_by_indices([4])  # clip 5 -> leaves an id gap
+
+    # Display: clip 8,7,6,4,3,2,1 -> delete #2-#4 (7,6,4) and #6-#9 (2,1)
+    count = history_store.delete_by_ranges([(2, 4), (6, 9)])
+    assert count == 5
+    assert history_store.get_clip(1) == b"clip 8"
+    assert history_store.get_clip(2) == b"clip 3"
+    assert history_store.count() == 2
+
+
+def test_ranges_groups_runs():
+    """_ranges yields inclusive runs of consecutive ints."""
+    from teeclip.history import _ranges
+    assert list(_ranges([1, 2, 3, 7, 9, 10])) == [(1, 3), (7, 7), (9, 10)]
+    assert list(_ranges([])) == []
+
+
 def test_delete_by_indices_empty_list(history_store):
     """Empty index list deletes nothing."""
     history_store.save(b"still here", source="test")
@@ -456,3 +575,32 @@ def test_parse_zero_index():
     from teeclip.cli import parse_clear_selector
     with pytest.raises(ValueError, match="positive"):
         parse_clear_selector("0")
+
+
+def test_get_clips_bulk(populated_history):
+    """get_clips_bulk returns content keyed by clip ID."""
+    entries = populated_history.list_recent(limit=3)
+    ids = [e.id for e in entries]
+    blobs = populated_history.get_clips_bulk(ids + [99999])
+    assert set(blobs) == set(ids)
+    assert blobs[entries[0].id] == b"clip 5"
+    assert populated_history.get_clips_bulk([]) == {}
+
+
+def test_parse_merges_adjacent_and_signed():
+    """Adjacent ranges merge; signed and padded parts still parse."""
+    from teeclip.cli import parse_clear_selector
+    assert parse_clear_selector("5:6, 1:4 ,+8") == [1, 2, 3, 4, 5, 6, 8]
+    with pytest.raises(ValueError, match="positive"):
+        parse_clear_selector("-1")
+    with pytest.raises(ValueError, match="expected START:END"):
+        parse_clear_selector("1:x")
+    with pytest.raises(ValueError, match="empty selector"):
+        parse_clear_selector(" , ")
+
+
+def test_parse_clear_ranges_stays_compact():
+    """parse_clear_ranges merges ranges without expanding them."""
+    from teeclip.cli import parse_clear_ranges
+    assert parse_clear_ranges("2,4:10,5:12") == [(2, 2), (4, 12)]
+    assert parse_clear_ranges("1:1000000000") == [(1, 1000000000)]
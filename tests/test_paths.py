@@ -0,0 +1,32 @@
+"""Tests for teeclip data directory resolution."""
+
+from pathlib import Path
+
+from teeclip._paths import (
+    get_data_dir, get_history_db_path, get_config_path, clear_path_cache,
+)
+
+
+def test_teeclip_home_override(teeclip_home):
+    assert get_data_dir() == teeclip_home
+    assert get_history_db_path() == teeclip_home / "history.db"
+    assert get_config_path() == teeclip_home / "config.toml"
+
+
+def test_paths_follow_env_changes(tmp_path, monkeypatch):
+    """Cached paths track TEECLIP_HOME changes without a manual clear."""
+    monkeypatch.setenv("TEECLIP_HOME", str(tmp_path / "one"))
+    assert get_data_dir() == tmp_path / "one"
+    monkeypatch.setenv("TEECLIP_HOME", str(tmp_path / "two"))
+    assert get_history_db_path() == tmp_path / "two" / "history.db"
+
+
+def test_default_is_under_home(monkeypatch, tmp_path):
+    monkeypatch.delenv("TEECLIP_HOME", raising=False)
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("USERPROFILE", str(tmp_path))
+    clear_path_cache()
+    try:
+        assert get_data_dir() == Path(tmp_path) / ".teeclip"
+    finally:
+        clear_path_cache()
@@ -111,3 +111,35 @@ encryption = "none"
     fallback_result = loads(config_text)
     tomllib_result = tomllib.loads(config_text)
     assert fallback_result == tomllib_result
+
+
+def test_inline_comment_after_quoted_value():
+    result = loads('[test]\npath = "a # b"  # trailing')
+    assert result["test"]["path"] == "a # b"
+
+
+def test_inline_comment_without_space():
+    result = loads("[test]\nmode = auto#comment")
+    assert result["test"]["mode"] == "auto"
+
+
+def test_signed_and_malformed_integers():
+    result = loads("[test]\na = +7\nb = --5\nc = 12ab\nd = -")
+    assert result["test"]["a"] == 7
+    assert result["test"]["b"] == "--5"
+    assert result["test"]["c"] == "12ab"
+    assert result["test"]["d"] == "-"
+
+
+def test_root_keys_before_section():
+    result = loads("top = 1\n[history]\nenabled = true")
+    assert result == {"": {"top": 1}, "history": {"enabled": True}}
+
+
+def test_underscore_integers():
+    result = loads("[test]\na = 1_000\nb = -2_5\nc = 1__0\nd = _1\ne = 1_")
+    assert result["test"]["a"] == 1000
+    assert result["test"]["b"] == -25
+    assert result["test"]["c"] == "1__0"
+    assert result["test"]["d"] == "_1"
+    assert result["test"]["e"] == "1_"
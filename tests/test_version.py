@@ -0,0 +1,69 @@
+"""Tests for teeclip version metadata."""
+
+import subprocess
+import sys
+
+import teeclip
+
+
+def test_package_exposes_version():
+    """Version symbols are reachable from the package namespace."""
+    assert teeclip.__version__
+    assert teeclip.VERSION == teeclip.__version__
+    assert teeclip.BASE_VERSION == teeclip.get_base_version()
+
+
+def test_package_import_is_lazy():
+    """Importing teeclip does not execute the _version module."""
+    result = subprocess.run(
+        [sys.executable, "-c",
+         "import sys, teeclip; print('teeclip._version' in sys.modules)"],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0
+    assert result.stdout.strip() == "False"
+
+
+def test_package_dir_lists_version_symbols():
+    """dir(teeclip) includes the lazily-resolved names."""
+    names = dir(teeclip)
+    for name in teeclip.__all__:
+        assert name in names
+
+
+def _load_version_module(tmp_path, version_string):
+    """Load a copy of _version.py with a different __version__ string."""
+    import importlib.util
+    import re
+    from pathlib import Path
+
+    source = Path(teeclip.__file__).with_name("_version.py").read_text()
+    source = re.sub(r'__version__ = ".*"', f'__version__ = "{version_string}"', source)
+    path = tmp_path / "_version_copy.py"
+    path.write_text(source)
+    spec = importlib.util.spec_from_file_location("_version_copy", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_main_branch_versions(tmp_path):
+    v = _load_version_module(tmp_path, "0.2.2_main_9-20260218-8879256f")
+    assert v.BASE_VERSION == "0.2.2"
+    assert v.get_base_version() == "0.2.2"
+    assert ".dev" not in v.PIP_VERSION
+    assert v.DISPLAY_VERSION.endswith("0.2.2")
+
+
+def test_dev_branch_pip_version(tmp_path):
+    v = _load_version_module(tmp_path, "0.2.2_dev_14-20260218-8879256f")
+    assert v.PIP_VERSION.endswith(".dev14")
+    assert v.get_pip_version() == v.PIP_VERSION
+
+
+def test_plain_version_string(tmp_path):
+    """A bare semantic version (no build metadata) still parses."""
+    v = _load_version_module(tmp_path, "0.2.2")
+    assert v.BASE_VERSION.startswith("0.2.2")
+    assert ".dev" not in v.PIP_VERSION